@@ -1,10 +1,16 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
-from typing import Dict
+from fastapi.responses import RedirectResponse, Response
+from pydantic import BaseModel
+from starlette.exceptions import HTTPException as StarletteHTTPException
 import os
+import sys
 
+import orjson
+
+from src.api.error_handlers import register_exception_handlers
 from src.api.routes import router as api_router
+from src.core.config import settings
 
 app = FastAPI(
     title="Synthetic Data Service",
@@ -19,10 +25,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
+register_exception_handlers(app)
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    """Serialize HTTP error payloads with orjson (handles datetime natively)."""
+    detail = exc.detail
+    if isinstance(detail, BaseModel):
+        # Let pydantic-core dump models and embed the bytes as-is
+        detail = orjson.Fragment(detail.model_dump_json())
+    return Response(
+        content=orjson.dumps({"detail": detail}),
+        status_code=exc.status_code,
+        headers=getattr(exc, "headers", None),
+        media_type="application/json",
+    )
 
 
 @app.on_event("startup")
@@ -31,64 +54,123 @@ async def startup_event():
     import logging
     logger = logging.getLogger("uvicorn")
 
-    from src.core.config import settings
-    logger.info(f"Demo Mode: {settings.DEMO_MODE}")
+    logger.info("Demo Mode: %s", settings.DEMO_MODE)
 
-    # Check if Gradio routes exist
-    routes = [route.path for route in app.routes]
+    # Check if Gradio routes exist (included routers/mounts may not expose a path)
+    routes = [getattr(route, "path", "") for route in app.routes]
     has_gradio = any("/gradio" in path for path in routes)
 
     if has_gradio:
         logger.info("✅ Gradio routes detected")
+    elif not settings.MOUNT_GRADIO:
+        logger.info("API-only mode: Gradio mount disabled via MOUNT_GRADIO=false")
     else:
         logger.warning("⚠️ No Gradio routes found - Gradio may not be mounted")
 
-    logger.info(f"Total routes registered: {len(routes)}")
+    logger.info("Total routes registered: %d", len(routes))
 
 
-@app.get("/health")
-async def health_check() -> Dict:
-    """Health check endpoint for monitoring service status."""
-    from src.core.config import settings
-    response = {
+@app.on_event("startup")
+async def warmup_services():
+    """Build API services in a background thread so the first request finds them ready."""
+    import asyncio
+    import logging
+    import threading
+    logger = logging.getLogger("uvicorn")
+    loop = asyncio.get_running_loop()
+
+    def _warm_serving_thread():
+        # Faker state is per thread and requests generate data on the event
+        # loop thread, so its Faker has to be built there, not in the warmup thread
+        from src.api.routes import get_data_generator
+        try:
+            get_data_generator().warm_up()
+        except Exception as e:
+            logger.debug("Data generator warmup skipped: %s", e)
+
+    def _build_services():
+        from src.api.routes import get_schema_generator, get_data_generator, get_csv_exporter
+
+        # A request arriving mid-build waits on the singleton lock instead of
+        # constructing a second instance
+        for factory in (get_schema_generator, get_data_generator, get_csv_exporter):
+            try:
+                factory()
+            except Exception as e:
+                # e.g. missing API key - the request path reports this properly
+                logger.debug("Service warmup skipped for %s: %s", factory.__name__, e)
+
+        try:
+            loop.call_soon_threadsafe(_warm_serving_thread)
+        except RuntimeError:
+            # The app shut down before the build finished
+            pass
+
+    threading.Thread(target=_build_services, name="service-warmup", daemon=True).start()
+
+
+def _build_health_response() -> Response:
+    """Serialize the health payload once; settings are frozen after startup."""
+    payload = {
         "status": "healthy",
         "service": "synthetic-data-service",
         "demo_mode": settings.DEMO_MODE
     }
     if settings.DEMO_MODE:
-        response["note"] = "Running in demo mode - using mock data (no OpenAI API required)"
-    return response
+        payload["note"] = "Running in demo mode - using mock data (no OpenAI API required)"
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+
+# Pre-built responses: Starlette copies headers per send, so these are safe to reuse
+_HEALTH_RESPONSE = _build_health_response()
+_ROOT_REDIRECT = RedirectResponse(url="/gradio")
+
+
+@app.get("/health")
+async def health_check() -> Response:
+    """Health check endpoint for monitoring service status."""
+    return _HEALTH_RESPONSE
 
 
 @app.get("/")
-async def root():
+async def root() -> Response:
     """Redirect root to Gradio interface."""
-    return RedirectResponse(url="/gradio")
+    return _ROOT_REDIRECT
 
 
 # Mount Gradio app
-# Import here to avoid issues if gradio is not installed
+# Import here to avoid issues if gradio is not installed, and skip it entirely
+# for API-only deployments so Gradio/pandas never load at process start
 import logging
 logger = logging.getLogger("uvicorn")
 
-try:
-    from src.frontend.gradio_app import app as gradio_app
-    import gradio as gr
+if settings.MOUNT_GRADIO:
+    try:
+        from src.frontend.gradio_app import app as gradio_app
+        import gradio as gr
 
-    # Mount Gradio interface at /gradio path
-    app = gr.mount_gradio_app(app, gradio_app, path="/gradio")
-    logger.info("✅ Gradio interface mounted at /gradio")
-except ImportError as e:
-    logger.warning(f"⚠️ Gradio not available: {e}")
-    logger.warning("API-only mode: Install gradio to enable the web interface")
-except Exception as e:
-    logger.error(f"❌ Failed to mount Gradio: {e}")
-    import traceback
-    logger.error(traceback.format_exc())
+        # Mount Gradio interface at /gradio path
+        app = gr.mount_gradio_app(app, gradio_app, path="/gradio")
+        logger.info("✅ Gradio interface mounted at /gradio")
+    except ImportError as e:
+        logger.warning("⚠️ Gradio not available: %s", e)
+        logger.warning("API-only mode: Install gradio to enable the web interface")
+    except Exception as e:
+        logger.exception("❌ Failed to mount Gradio: %s", e)
 
 
 if __name__ == "__main__":
     import uvicorn
     # Get port from environment variable (for Heroku) or default to 8000
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    # Multiple workers need an import string; a single worker reuses this module's app
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        workers=workers,
+        access_log=False,
+    )
@@ -0,0 +1,115 @@
+"""Exception handlers translating service errors into API error responses."""
+
+from typing import Any
+
+import orjson
+from fastapi import FastAPI, Request, status
+from fastapi.responses import Response
+
+from src.api.models import ErrorResponse
+from src.core.exceptions import (
+    BaseServiceException,
+    SchemaGenerationError,
+    RateLimitError,
+    APIConnectionError,
+    ConfigurationError,
+    ValidationError
+)
+
+
+def _error_response(status_code: int, error_type: str, message: str, **details: Any) -> Response:
+    """
+    Build a JSON error response in the same shape as an HTTPException detail.
+
+    Args:
+        status_code: HTTP status code
+        error_type: Error category (validation, rate_limit, api_failure, ...)
+        message: Human-readable error message
+        **details: Additional error details
+
+    Returns:
+        Response with body ``{"detail": <ErrorResponse>}``
+    """
+    error = ErrorResponse(error_type=error_type, message=message, details=details)
+    return Response(
+        content=orjson.dumps({"detail": orjson.Fragment(error.model_dump_json())}),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _description(request: Request) -> str:
+    """Description stored on request.state by the generate route, if any."""
+    return getattr(request.state, "description", "")
+
+
+async def validation_error_handler(request: Request, exc: ValidationError) -> Response:
+    """Handle input/dataset validation failures."""
+    return _error_response(
+        status.HTTP_422_UNPROCESSABLE_ENTITY, "validation", str(exc), description=_description(request)
+    )
+
+
+async def rate_limit_error_handler(request: Request, exc: RateLimitError) -> Response:
+    """Handle upstream rate limiting."""
+    return _error_response(status.HTTP_429_TOO_MANY_REQUESTS, "rate_limit", str(exc), retry_after=60)
+
+
+async def api_connection_error_handler(request: Request, exc: APIConnectionError) -> Response:
+    """Handle failures reaching the LLM provider."""
+    return _error_response(status.HTTP_502_BAD_GATEWAY, "api_failure", str(exc), provider="openai")
+
+
+async def schema_generation_error_handler(request: Request, exc: SchemaGenerationError) -> Response:
+    """Handle schema generation failures."""
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "generation_failure",
+        str(exc),
+        description_preview=_description(request)[:100]
+    )
+
+
+async def service_error_handler(request: Request, exc: BaseServiceException) -> Response:
+    """Handle any other service error without exposing its message."""
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "generation_failure",
+        "An unexpected error occurred during dataset generation",
+        error_id=str(hash(str(exc)))[:8]
+    )
+
+
+async def configuration_error_handler(request: Request, exc: ConfigurationError) -> Response:
+    """Handle configuration errors such as a missing API key."""
+    if "OPENAI_API_KEY" in str(exc):
+        return _error_response(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            "api_failure",
+            "Service is not properly configured. Please check API key settings.",
+            configuration="missing_api_key"
+        )
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "configuration_error",
+        "Service configuration error",
+        error_id=str(hash(str(exc)))[:8]
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Register the service exception handlers on the application.
+
+    Handlers are resolved along the exception's MRO, so the specific service
+    errors take precedence over the BaseServiceException fallback.
+
+    Args:
+        app: FastAPI application
+    """
+    app.add_exception_handler(ValidationError, validation_error_handler)
+    app.add_exception_handler(RateLimitError, rate_limit_error_handler)
+    app.add_exception_handler(APIConnectionError, api_connection_error_handler)
+    app.add_exception_handler(SchemaGenerationError, schema_generation_error_handler)
+    app.add_exception_handler(ConfigurationError, configuration_error_handler)
+    app.add_exception_handler(BaseServiceException, service_error_handler)
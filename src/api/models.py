@@ -1,20 +1,29 @@
-from pydantic import BaseModel, Field
-from typing import Dict, Optional, Any, List
+from pydantic import BaseModel, ConfigDict, Field, SerializerFunctionWrapHandler, model_serializer
+from typing import Dict, Optional, Any, Iterator, List, Sequence
 from datetime import datetime
 
+from src.core.config import settings
+
 
 class DatasetRequest(BaseModel):
-    """Request model for dataset generation."""
+    """
+    Request model for dataset generation.
+    
+    Length and row bounds come from settings, so they are fixed when the
+    validator is built at import time.
+    """
+    model_config = ConfigDict(frozen=True)
+
     description: str = Field(
         ..., 
-        min_length=10, 
-        max_length=4000, 
+        min_length=settings.MIN_DESCRIPTION_LENGTH, 
+        max_length=settings.MAX_DESCRIPTION_LENGTH, 
         description="Natural language description of the dataset needs"
     )
     rows: int = Field(
-        default=1000, 
-        ge=1, 
-        le=10000, 
+        default=min(1000, settings.MAX_ROWS), 
+        ge=settings.MIN_ROWS, 
+        le=settings.MAX_ROWS, 
         description="Number of rows to generate"
     )
     format: str = Field(
@@ -26,6 +35,9 @@ class DatasetRequest(BaseModel):
 
 class GeneratedSchema(BaseModel):
     """Response model for generated schema."""
+    # Immutable so the schema cache can hand the same instance to every caller
+    model_config = ConfigDict(frozen=True)
+
     description_hash: str = Field(..., description="SHA-256 hash of the description")
     fields_schema: Dict[str, Any] = Field(..., description="Generated Faker-compatible schema")
     created_at: datetime = Field(..., description="Timestamp when schema was created")
@@ -34,32 +46,73 @@ class GeneratedSchema(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Standardized error response model."""
+    model_config = ConfigDict(frozen=True)
+
     error_type: str = Field(..., description="Type of error (validation, generation_failure, rate_limit, api_failure)")
     message: str = Field(..., description="Human-readable error message")
     details: Dict[str, Any] = Field(default_factory=dict, description="Additional error details")
     timestamp: datetime = Field(default_factory=datetime.now, description="Error timestamp")
 
-    model_config = {"json_encoders": {datetime: lambda v: v.isoformat()}}
-
 
 class GenerateResponse(BaseModel):
     """Response model for successful schema generation."""
+    model_config = ConfigDict(frozen=True)
+
     fields_schema: Dict[str, Any] = Field(..., description="Generated Faker-compatible schema")
     metadata: Dict[str, Any] = Field(..., description="Generation metadata including timing and domain")
 
 
 class SyntheticDataset(BaseModel):
-    """Data model for generated synthetic datasets."""
-    data: List[Dict[str, Any]] = Field(..., description="Array of generated data records")
+    """
+    Data model for generated synthetic datasets.
+    
+    Generated datasets are stored column-wise in ``columns``; the per-row
+    dicts in ``data`` are only built the first time it is read. Datasets can
+    still be constructed from row records via ``data=[...]``, and dumps keep
+    that shape: row records under ``data``, no ``columns``.
+    """
+    columns: Optional[Dict[str, List[Any]]] = Field(
+        default=None, exclude=True, description="Generated values keyed by field name"
+    )
+    records: Optional[List[Dict[str, Any]]] = Field(
+        default=None, alias="data", exclude=True, description="Array of generated data records"
+    )
     row_count: int = Field(..., description="Actual number of rows generated")
     field_names: List[str] = Field(..., description="Column headers from schema")
     generation_time: float = Field(..., description="Time taken to generate data in seconds")
     domain: str = Field(..., description="Domain category of the dataset")
 
+    @model_serializer(mode="wrap")
+    def _serialize_with_data(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        """Dump the row records under ``data``, as before columnar storage."""
+        return {"data": self.data, **handler(self)}
+
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        """Row records, materialized from the columns on first access."""
+        if self.records is None:
+            self.records = list(self.rows())
+        return self.records
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over row dicts without materializing the whole record list."""
+        if self.records is not None or self.columns is None:
+            return iter(self.records or [])
+        field_names = self.field_names
+        return (dict(zip(field_names, values)) for values in self.row_values())
+
+    def row_values(self) -> Iterator[Sequence[Any]]:
+        """Iterate over rows as value sequences in ``field_names`` order."""
+        field_names = self.field_names
+        if self.records is None and self.columns is not None:
+            return zip(*(self.columns[name] for name in field_names))
+        return ([record.get(name) for name in field_names] for record in self.records or [])
+
 
 class DatasetResponse(BaseModel):
     """Response model for CSV dataset export."""
     csv_content: str = Field(..., description="Generated CSV data as string")
     filename: str = Field(..., description="Suggested filename from description")
     row_count: int = Field(..., description="Number of rows in dataset")
-    content_type: str = Field(default="text/csv", description="MIME type for response")
\ No newline at end of file
+    content_type: str = Field(default="text/csv", description="MIME type for response")
+    byte_length: Optional[int] = Field(default=None, description="UTF-8 size of csv_content in bytes")
\ No newline at end of file
@@ -1,68 +1,128 @@
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse, Response
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse
+from typing import Dict, Any, Callable, Optional, Tuple, TypeVar, TYPE_CHECKING
+from functools import wraps
+import asyncio
+import itertools
+import logging
+import threading
 import time
-from datetime import datetime
 
-from src.api.models import DatasetRequest, GenerateResponse, ErrorResponse
-from src.services.schema_generator import SchemaGenerator
-from src.services.data_generator import DataGenerator
-from src.services.csv_exporter import CSVExporter
+from src.api.models import DatasetRequest, ErrorResponse
 from src.core.config import settings
-from src.core.exceptions import (
-    SchemaGenerationError, 
-    RateLimitError, 
-    APIConnectionError,
-    ValidationError
-)
+from src.core.exceptions import BaseServiceException, ConfigurationError
+
+# Service modules pull in the LLM SDKs, Faker and NumPy, so they are only
+# imported by the factories below when a request actually needs them
+if TYPE_CHECKING:
+    from src.services.mock_schema_generator import MockSchemaGenerator
+    from src.services.schema_generator import SchemaGenerator
+    from src.services.data_generator import DataGenerator
+    from src.services.csv_exporter import CSVExporter
+
+_LAZY_SERVICE_CLASSES = {
+    "SchemaGenerator": "src.services.schema_generator",
+    "DataGenerator": "src.services.data_generator",
+    "CSVExporter": "src.services.csv_exporter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the service classes formerly imported at module level on first access."""
+    if name in _LAZY_SERVICE_CLASSES:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_SERVICE_CLASSES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 router = APIRouter()
 
+logger = logging.getLogger("uvicorn")
+
+T = TypeVar("T")
+
+
+def _lazy_singleton(factory: Callable[[], T]) -> Callable[[], T]:
+    """
+    Wrap a zero-argument factory so it builds its instance once and then reuses it.
+    
+    Construction runs under a lock so concurrent first calls share a single
+    instance; once built, callers return it without taking the lock. A factory
+    that raises (e.g. missing API key) is retried on the next call.
+    
+    Args:
+        factory: Callable that constructs the service
+        
+    Returns:
+        Accessor returning the shared instance
+    """
+    instance: Optional[T] = None
+    lock = threading.Lock()
+    
+    @wraps(factory)
+    def accessor() -> T:
+        nonlocal instance
+        if instance is None:
+            with lock:
+                if instance is None:
+                    instance = factory()
+        return instance
+    
+    return accessor
+
+
 # Initialize services lazily to allow server to start without API key
-_schema_generator = None
-_mock_schema_generator = None
-_data_generator = None
-_csv_exporter = None
+@_lazy_singleton
+def _get_mock_schema_generator() -> "MockSchemaGenerator":
+    """Build the demo-mode schema generator."""
+    from src.services.mock_schema_generator import MockSchemaGenerator
+    logger.debug("Initializing MockSchemaGenerator (DEMO_MODE=%s)", settings.DEMO_MODE)
+    return MockSchemaGenerator()
+
+@_lazy_singleton
+def _get_real_schema_generator() -> "SchemaGenerator":
+    """Build the API-backed schema generator."""
+    from src.services.schema_generator import SchemaGenerator
+    logger.debug("Initializing SchemaGenerator (DEMO_MODE=%s)", settings.DEMO_MODE)
+    return SchemaGenerator()
 
 def get_schema_generator():
     """
     Get schema generator instance, initializing if needed.
     Returns MockSchemaGenerator in demo mode, SchemaGenerator otherwise.
     """
-    global _schema_generator, _mock_schema_generator
-
-    # Debug: Log what mode we're in
-    import logging
-    logger = logging.getLogger("uvicorn")
-    logger.info(f"get_schema_generator called - DEMO_MODE={settings.DEMO_MODE}")
-
-    # Use mock generator in demo mode
     if settings.DEMO_MODE:
-        logger.info("Using MockSchemaGenerator")
-        if _mock_schema_generator is None:
-            from src.services.mock_schema_generator import MockSchemaGenerator
-            _mock_schema_generator = MockSchemaGenerator()
-        return _mock_schema_generator
-
-    # Use real generator in production mode
-    logger.info("Using real SchemaGenerator")
-    if _schema_generator is None:
-        _schema_generator = SchemaGenerator()
-    return _schema_generator
-
-def get_data_generator() -> DataGenerator:
+        return _get_mock_schema_generator()
+    return _get_real_schema_generator()
+
+@_lazy_singleton
+def get_data_generator() -> "DataGenerator":
     """Get data generator instance, initializing if needed."""
-    global _data_generator
-    if _data_generator is None:
-        _data_generator = DataGenerator()
-    return _data_generator
+    from src.services.data_generator import DataGenerator
+    return DataGenerator.get()
 
-def get_csv_exporter() -> CSVExporter:
+@_lazy_singleton
+def get_csv_exporter() -> "CSVExporter":
     """Get CSV exporter instance, initializing if needed."""
-    global _csv_exporter
-    if _csv_exporter is None:
-        _csv_exporter = CSVExporter()
-    return _csv_exporter
+    from src.services.csv_exporter import CSVExporter
+    return CSVExporter()
+
+
+def _error_detail(error_type: str, message: str, **details: Any) -> ErrorResponse:
+    """
+    Build the standard error payload for an HTTPException detail.
+    
+    The timestamp is only taken here, so the success path never pays for it.
+    
+    Args:
+        error_type: Error category (validation, rate_limit, api_failure, ...)
+        message: Human-readable error message
+        **details: Additional error details
+        
+    Returns:
+        ErrorResponse: Error payload, serialized by the HTTPException handler in main.py
+    """
+    return ErrorResponse(error_type=error_type, message=message, details=details)
 
 
 @router.post(
@@ -71,20 +131,27 @@ def get_csv_exporter() -> CSVExporter:
     summary="Generate synthetic dataset",
     description="Generate a complete synthetic dataset as CSV from natural language description"
 )
-async def generate_dataset(request: DatasetRequest) -> Response:
+async def generate_dataset(request: DatasetRequest, http_request: Request) -> Response:
     """
     Generate a complete synthetic dataset as CSV from natural language description.
     
+    Service errors propagate to the handlers registered in src.api.error_handlers;
+    only unexpected exceptions are translated here.
+    
     Args:
         request: Dataset request containing description, rows, and format
+        http_request: Raw request, used to hand the description to error handlers
         
     Returns:
         CSV file response with generated synthetic data
         
     Raises:
-        HTTPException: On validation, generation, or API failures
+        BaseServiceException: On validation, generation, or API failures
+        ConfigurationError: On configuration errors such as a missing API key
+        HTTPException: On any other unexpected failure
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
+    http_request.state.description = request.description
     
     try:
         # Get service instances
@@ -98,107 +165,67 @@ async def generate_dataset(request: DatasetRequest) -> Response:
         # Step 2: Generate synthetic data using Faker
         synthetic_dataset = data_generator.generate_data(generated_schema, request.rows)
         
-        # Step 3: Export to CSV
-        csv_response = csv_exporter.export_to_csv(synthetic_dataset, request.description)
+        # Step 3: Stream as CSV (validated up front, encoded chunk by chunk)
+        csv_stream = csv_exporter.iter_csv(synthetic_dataset)
+        filename = csv_exporter.generate_filename(request.description, synthetic_dataset.domain)
+        
+        # A CSV that fits in one chunk is sent whole, so its size can be reported
+        first_chunk = next(csv_stream, b"")
+        second_chunk = next(csv_stream, None)
         
-        # Calculate total processing time
-        total_time = time.time() - start_time
+        # Processing time up to the first byte; CSV encoding happens while streaming
+        total_time = time.perf_counter() - start_time
         
         # Get CSV response headers
-        headers = csv_exporter.get_csv_headers(csv_response)
+        headers = csv_exporter.get_stream_headers(filename, synthetic_dataset.row_count)
         headers["X-Generation-Time"] = str(round(total_time, 3))
         headers["X-Domain"] = generated_schema.domain
         headers["X-Description-Hash"] = generated_schema.description_hash
         if settings.DEMO_MODE:
             headers["X-Demo-Mode"] = "true"
         
+        if second_chunk is None:
+            headers["X-Content-Length"] = str(len(first_chunk))
+            return Response(
+                content=first_chunk,
+                media_type="text/csv",
+                headers=headers
+            )
+        
         # Return CSV as response
-        return Response(
-            content=csv_response.csv_content,
+        return StreamingResponse(
+            itertools.chain((first_chunk, second_chunk), csv_stream),
             media_type="text/csv",
             headers=headers
         )
         
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={
-                "error_type": "validation",
-                "message": str(e),
-                "details": {"description": request.description},
-                "timestamp": datetime.now().isoformat()
-            }
-        )
-        
-    except RateLimitError as e:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail={
-                "error_type": "rate_limit",
-                "message": str(e),
-                "details": {"retry_after": 60},
-                "timestamp": datetime.now().isoformat()
-            }
-        )
-        
-    except APIConnectionError as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail={
-                "error_type": "api_failure",
-                "message": str(e),
-                "details": {"provider": "openai"},
-                "timestamp": datetime.now().isoformat()
-            }
-        )
-        
-    except SchemaGenerationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error_type": "generation_failure",
-                "message": str(e),
-                "details": {"description_preview": request.description[:100]},
-                "timestamp": datetime.now().isoformat()
-            }
-        )
+    except BaseServiceException:
+        # Translated into error responses by src.api.error_handlers
+        raise
         
     except ValueError as e:
-        # Handle configuration errors (like missing API key)
-        if "OPENAI_API_KEY" in str(e):
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail={
-                    "error_type": "api_failure",
-                    "message": "Service is not properly configured. Please check API key settings.",
-                    "details": {"configuration": "missing_api_key"},
-                    "timestamp": datetime.now().isoformat()
-                }
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error_type": "configuration_error",
-                    "message": "Service configuration error",
-                    "details": {"error_id": str(hash(str(e)))[:8]},
-                    "timestamp": datetime.now().isoformat()
-                }
-            )
-            
+        # Service constructors report configuration problems as ValueError
+        raise ConfigurationError(str(e)) from e
+        
     except Exception as e:
         # Never log sensitive information like API keys
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error_type": "generation_failure",
-                "message": "An unexpected error occurred during dataset generation",
-                "details": {"error_id": str(hash(str(e)))[:8]},
-                "timestamp": datetime.now().isoformat()
-            }
+            detail=_error_detail(
+                "generation_failure",
+                "An unexpected error occurred during dataset generation",
+                error_id=str(hash(str(e)))[:8]
+            )
         )
 
 
+# Short-lived snapshot of /cache/stats as (time.monotonic(), stats). The pair is
+# replaced as a whole, and _stats_lock lets only one thread recompute it.
+CACHE_STATS_TTL_SECONDS = 5.0
+_stats_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {"entry": (0.0, None)}
+_stats_lock = threading.Lock()
+
+
 @router.get(
     "/cache/stats",
     response_model=Dict[str, Any],
@@ -206,18 +233,51 @@ async def generate_dataset(request: DatasetRequest) -> Response:
     summary="Get cache statistics",
     description="Retrieve cache performance and health statistics"
 )
-async def get_cache_stats() -> Dict[str, Any]:
+async def get_cache_stats(response: Response) -> Dict[str, Any]:
     """
     Get cache statistics for monitoring and debugging.
     
+    Results are reused for ``CACHE_STATS_TTL_SECONDS`` so frequent monitoring
+    scrapes do not hit the cache file on every request. Misses flush and read
+    the cache files, so they run in a worker thread.
+    
     Returns:
         dict: Cache statistics including total schemas, file sizes, health status
     """
+    response.headers["Cache-Control"] = f"public, max-age={int(CACHE_STATS_TTL_SECONDS)}"
+    
+    stats = _fresh_cache_stats(time.monotonic())
+    if stats is None:
+        stats = await asyncio.to_thread(_refresh_cache_stats)
+    return stats
+
+
+def _fresh_cache_stats(now: float) -> Optional[Dict[str, Any]]:
+    """Snapshotted stats if they are younger than CACHE_STATS_TTL_SECONDS."""
+    computed_at, stats = _stats_cache["entry"]
+    if stats is not None and now - computed_at < CACHE_STATS_TTL_SECONDS:
+        return stats
+    return None
+
+
+def _refresh_cache_stats() -> Dict[str, Any]:
+    """Recompute the snapshot unless another thread just did; blocking."""
+    with _stats_lock:
+        now = time.monotonic()
+        stats = _fresh_cache_stats(now)
+        if stats is None:
+            stats = _compute_cache_stats()
+            _stats_cache["entry"] = (now, stats)
+        return stats
+
+
+def _compute_cache_stats() -> Dict[str, Any]:
+    """Read cache statistics from disk (uncached)."""
     try:
         # Try to get cache stats without initializing full schema generator
         if settings.CACHE_ENABLED:
-            from src.services.cache_service import SchemaCache
-            cache = SchemaCache()
+            from src.services.cache_service import get_schema_cache
+            cache = get_schema_cache()
             stats = cache.get_cache_stats()
             stats["cache_enabled"] = True
             stats["cache_healthy"] = cache.is_cache_healthy()
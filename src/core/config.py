@@ -1,91 +1,146 @@
 """Configuration management for the synthetic data service."""
 
-import os
 from typing import Optional
 from dotenv import load_dotenv
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables from .env file
+from src.core.exceptions import ConfigurationError
+
+# Load environment variables from .env file (also exposes them via os.environ
+# for libraries that read their own variables)
 load_dotenv()
 
 
-class Settings:
-    """Application settings loaded from environment variables."""
+class Settings(BaseSettings):
+    """
+    Application settings loaded from environment variables.
+    
+    Values are parsed and type-checked once when the module is imported; the
+    instance is frozen so ``settings`` can be shared freely.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        extra="ignore",
+        case_sensitive=True,
+        frozen=True,
+    )
 
     # API Provider Selection
-    API_PROVIDER: str = os.getenv("API_PROVIDER", "openai").lower()  # "openai" or "anthropic"
+    API_PROVIDER: str = "openai"  # "openai" or "anthropic"
 
     # OpenAI Configuration
-    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-    OPENAI_MAX_TOKENS: int = int(os.getenv("OPENAI_MAX_TOKENS", "4000"))
-    OPENAI_TEMPERATURE: float = float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
-    OPENAI_REQUEST_TIMEOUT: int = int(os.getenv("OPENAI_REQUEST_TIMEOUT", "30"))
+    OPENAI_API_KEY: Optional[str] = None
+    OPENAI_MODEL: str = "gpt-4o-mini"
+    OPENAI_MAX_TOKENS: int = 4000
+    OPENAI_TEMPERATURE: float = 0.7
+    OPENAI_REQUEST_TIMEOUT: int = 30
 
     # Anthropic Configuration
-    ANTHROPIC_API_KEY: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
-    ANTHROPIC_MODEL: str = os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-5")
-    ANTHROPIC_MAX_TOKENS: int = int(os.getenv("ANTHROPIC_MAX_TOKENS", "4096"))
-    ANTHROPIC_TEMPERATURE: float = float(os.getenv("ANTHROPIC_TEMPERATURE", "0.7"))
+    ANTHROPIC_API_KEY: Optional[str] = None
+    ANTHROPIC_MODEL: str = "claude-sonnet-4-5"
+    ANTHROPIC_MAX_TOKENS: int = 4096
+    ANTHROPIC_TEMPERATURE: float = 0.7
+    # Cheaper/faster model tried first for short descriptions (e.g. claude-3-5-haiku-latest);
+    # ANTHROPIC_MODEL is used as the fallback when its schema fails to parse or validate
+    ANTHROPIC_MODEL_FAST: Optional[str] = None
+    
+    # Anthropic Message Batches (half-price, up to 24h turnaround) for bulk generation
+    USE_BATCH_API: bool = False
+    BATCH_POLL_INITIAL_SECONDS: float = 5.0
+    BATCH_POLL_MAX_SECONDS: float = 60.0
+    # Give up on (and cancel) a batch that has not ended within this many seconds
+    BATCH_TIMEOUT_SECONDS: float = 3600.0
 
     # General API Settings
-    API_REQUEST_TIMEOUT: int = int(os.getenv("API_REQUEST_TIMEOUT", "30"))
+    API_REQUEST_TIMEOUT: int = 30
     
     # Rate Limiting
-    RATE_LIMIT_REQUESTS_PER_MINUTE: int = int(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "3"))
-    RATE_LIMIT_REQUESTS_PER_DAY: int = int(os.getenv("RATE_LIMIT_REQUESTS_PER_DAY", "200"))
-    RATE_LIMIT_TOKENS_PER_MINUTE: int = int(os.getenv("RATE_LIMIT_TOKENS_PER_MINUTE", "10000"))
+    RATE_LIMIT_REQUESTS_PER_MINUTE: int = 3
+    RATE_LIMIT_REQUESTS_PER_DAY: int = 200
+    RATE_LIMIT_TOKENS_PER_MINUTE: int = 10000
     
     # Cache Settings
-    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
-    CACHE_FILE_PATH: str = os.getenv("CACHE_FILE_PATH", "data/schemas.json")
-    CACHE_BACKUP_PATH: str = os.getenv("CACHE_BACKUP_PATH", "data/schemas.json.backup")
+    CACHE_ENABLED: bool = True
+    CACHE_DIR: str = "data/schemas"  # one <hash>.json per schema plus index.jsonl
+    CACHE_FILE_PATH: str = "data/schemas.json"  # legacy single-file cache, imported once
+    CACHE_BACKUP_PATH: str = "data/schemas.json.backup"
+    
+    # Semantic cache (requires the optional sentence-transformers package)
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_MODEL: str = "all-MiniLM-L6-v2"
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92
+    SEMANTIC_CACHE_PATH: str = "data/schema_embeddings.npz"
     
     # Application Settings
-    MAX_DESCRIPTION_LENGTH: int = int(os.getenv("MAX_DESCRIPTION_LENGTH", "4000"))
-    MIN_DESCRIPTION_LENGTH: int = int(os.getenv("MIN_DESCRIPTION_LENGTH", "10"))
-    MAX_ROWS: int = int(os.getenv("MAX_ROWS", "10000"))
-    MIN_ROWS: int = int(os.getenv("MIN_ROWS", "1"))
+    MAX_DESCRIPTION_LENGTH: int = 4000
+    MIN_DESCRIPTION_LENGTH: int = 10
+    MAX_ROWS: int = 10000
+    MIN_ROWS: int = 1
 
     # Demo/Test Mode (allows running without OpenAI API key)
-    DEMO_MODE: bool = os.getenv("DEMO_MODE", "false").lower() == "true"
+    DEMO_MODE: bool = False
+
+    # Frontend (set to false for API-only deployments to skip loading Gradio)
+    MOUNT_GRADIO: bool = True
+
+    @field_validator("API_PROVIDER", mode="before")
+    @classmethod
+    def _normalize_provider(cls, value: str) -> str:
+        """Accept provider names in any case."""
+        return value.strip().lower() if isinstance(value, str) else value
+
+    @field_validator("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "ANTHROPIC_MODEL_FAST", mode="before")
+    @classmethod
+    def _blank_key_to_none(cls, value: Optional[str]) -> Optional[str]:
+        """Treat an empty value (e.g. ``OPENAI_API_KEY=`` in .env) as unset."""
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
 
     def validate_settings(self) -> None:
-        """Validate required settings are present."""
+        """
+        Validate required settings are present.
+
+        Raises:
+            ConfigurationError: If the provider or its API key is missing or invalid
+        """
         # Skip API key validation in demo mode
         if self.DEMO_MODE:
             return
 
         # Validate API provider selection
         if self.API_PROVIDER not in ["openai", "anthropic"]:
-            raise ValueError(
+            raise ConfigurationError(
                 f"API_PROVIDER must be 'openai' or 'anthropic', got '{self.API_PROVIDER}'"
             )
 
         # Validate appropriate API key based on provider
         if self.API_PROVIDER == "openai":
             if not self.OPENAI_API_KEY:
-                raise ValueError(
+                raise ConfigurationError(
                     "OPENAI_API_KEY environment variable is required when API_PROVIDER=openai. "
                     "Please set it in your .env file or environment. "
                     "Or set DEMO_MODE=true to test without an API key."
                 )
 
             if not self.OPENAI_API_KEY.startswith(("sk-", "sk-proj-")):
-                raise ValueError(
+                raise ConfigurationError(
                     "OPENAI_API_KEY appears to be invalid. "
                     "It should start with 'sk-' or 'sk-proj-'"
                 )
 
         elif self.API_PROVIDER == "anthropic":
             if not self.ANTHROPIC_API_KEY:
-                raise ValueError(
+                raise ConfigurationError(
                     "ANTHROPIC_API_KEY environment variable is required when API_PROVIDER=anthropic. "
                     "Please set it in your .env file or environment. "
                     "Or set DEMO_MODE=true to test without an API key."
                 )
 
             if not self.ANTHROPIC_API_KEY.startswith("sk-ant-"):
-                raise ValueError(
+                raise ConfigurationError(
                     "ANTHROPIC_API_KEY appears to be invalid. "
                     "It should start with 'sk-ant-'"
                 )
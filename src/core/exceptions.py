@@ -33,4 +33,9 @@ class CacheError(BaseServiceException):
 
 class ParsingError(BaseServiceException):
     """Raised when response parsing fails."""
-    pass
\ No newline at end of file
+    pass
+
+
+class ConfigurationError(BaseServiceException, ValueError):
+    """Raised when the service is misconfigured (e.g. a missing API key)."""
+    pass
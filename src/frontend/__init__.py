@@ -1 +1,14 @@
 """Frontend module for Gradio interface."""
+
+from typing import Any
+
+# Resolved lazily so importing this package does not pull in Gradio
+_LAZY_ATTRS = ("app", "create_gradio_interface", "GradioInterface")
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Gradio app module on first access to one of its exports."""
+    if name in _LAZY_ATTRS:
+        from src.frontend import gradio_app
+        return getattr(gradio_app, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,15 +3,16 @@ Gradio frontend for the Synthetic Data Generator.
 This module provides a user-friendly web interface for generating synthetic datasets.
 """
 
+import itertools
+import os
+import tempfile
+
 import gradio as gr
-import pandas as pd
-from io import StringIO
 from typing import Tuple, Optional
 import time
 from datetime import datetime
 
-from src.services.data_generator import DataGenerator
-from src.services.csv_exporter import CSVExporter
+from src.api.models import SyntheticDataset
 from src.core.exceptions import (
     SchemaGenerationError,
     RateLimitError,
@@ -20,9 +21,15 @@ from src.core.exceptions import (
 )
 
 
+# Spaces become underscores; commas and periods are dropped from download names
+_FILENAME_TRANSLATION = str.maketrans({' ': '_', ',': None, '.': None})
+
+
 class GradioInterface:
     """Gradio interface for synthetic data generation."""
 
+    __slots__ = ("schema_generator", "data_generator", "csv_exporter")
+
     def __init__(self):
         """Initialize the Gradio interface with service instances."""
         self.schema_generator = None
@@ -46,10 +53,38 @@ class GradioInterface:
                 self.schema_generator = SchemaGenerator()
 
         if self.data_generator is None:
-            self.data_generator = DataGenerator()
+            from src.services.data_generator import DataGenerator
+            self.data_generator = DataGenerator.get()
         if self.csv_exporter is None:
+            from src.services.csv_exporter import CSVExporter
             self.csv_exporter = CSVExporter()
 
+    def _write_download_file(self, description: str, dataset: SyntheticDataset) -> str:
+        """
+        Write the dataset as CSV to a temporary file for Gradio download.
+
+        The exporter streams encoded chunks to the file, so the CSV is never
+        held as one string.
+
+        Args:
+            description: Dataset description, used for the filename
+            dataset: Generated synthetic dataset
+
+        Returns:
+            Path of the written CSV file
+
+        Raises:
+            ValidationError: If the dataset cannot be exported
+        """
+        # Create filename from description
+        filename = description[:50].translate(_FILENAME_TRANSLATION)
+        filename = f"synthetic_data_{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        temp_path = os.path.join(tempfile.gettempdir(), filename)
+
+        self.csv_exporter.write_csv_file(dataset, temp_path)
+
+        return temp_path
+
     async def generate_dataset(
         self,
         description: str,
@@ -90,16 +125,19 @@ class GradioInterface:
 
             # Step 3: Export to CSV
             progress(0.8, desc="Exporting to CSV...")
-            csv_response = self.csv_exporter.export_to_csv(synthetic_dataset, description)
+            csv_path = self._write_download_file(description, synthetic_dataset)
 
             # Calculate metrics
             total_time = time.time() - start_time
             rows_per_second = num_rows / total_time if total_time > 0 else 0
 
-            # Create preview (first 100 rows)
-            csv_data = StringIO(csv_response.csv_content)
-            df = pd.read_csv(csv_data)
-            preview_df = df.head(100) if len(df) > 100 else df
+            # Create preview (first 100 rows) straight from the dataset,
+            # instead of re-parsing the whole CSV or building every row dict
+            import pandas as pd
+            preview_df = pd.DataFrame(
+                list(itertools.islice(synthetic_dataset.row_values(), 100)),
+                columns=synthetic_dataset.field_names
+            )
 
             # Create success message
             status_msg = (
@@ -113,7 +151,7 @@ class GradioInterface:
             progress(1.0, desc="Complete!")
 
             # Return preview as HTML table and CSV content for download
-            return preview_df.to_html(index=False, max_rows=100), csv_response.csv_content, status_msg
+            return preview_df.to_html(index=False, max_rows=100), csv_path, status_msg
 
         except ValidationError as e:
             return None, None, f"❌ Validation Error: {str(e)}"
@@ -254,22 +292,10 @@ def create_gradio_interface() -> gr.Blocks:
         # Event handler
         async def generate_and_update(description: str, num_rows: int, progress=gr.Progress()):
             """Handle generate button click with progress tracking."""
-            preview, csv_content, status = await interface.generate_dataset(description, num_rows, progress)
-
-            # Create temporary file for download if generation was successful
-            if csv_content:
-                # Create filename from description
-                filename = description[:50].replace(' ', '_').replace(',', '').replace('.', '')
-                filename = f"synthetic_data_{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            preview, csv_path, status = await interface.generate_dataset(description, num_rows, progress)
 
-                # Save to temporary file for Gradio download
-                temp_path = f"/tmp/{filename}"
-                with open(temp_path, 'w') as f:
-                    f.write(csv_content)
-
-                return preview, status, temp_path
-            else:
-                return preview, status, None
+            # csv_path is None when generation failed
+            return preview, status, csv_path
 
         generate_btn.click(
             fn=generate_and_update,
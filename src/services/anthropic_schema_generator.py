@@ -1,14 +1,19 @@
 """Schema generation service using Anthropic Claude API."""
 
-import json
 import asyncio
-from datetime import datetime
-from typing import Dict, Any
+import random
+import re
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, List, Optional, Union
 import time
+import anthropic
+import orjson
 from anthropic import AsyncAnthropic
 
 from src.core.config import settings
 from src.core.exceptions import (
+    BaseServiceException,
     SchemaGenerationError,
     RateLimitError,
     APIConnectionError,
@@ -17,18 +22,128 @@ from src.core.exceptions import (
 )
 from src.api.models import GeneratedSchema
 from src.utils.hash_utils import generate_cache_key
-from src.services.cache_service import SchemaCache
+from src.utils.embeddings import embed_description
+from src.services.cache_service import get_schema_cache
+
+
+def _next_local_midnight() -> float:
+    """Epoch timestamp of the next local midnight, when the daily limit resets."""
+    return datetime.combine(date.today() + timedelta(days=1), datetime.min.time()).timestamp()
+
+
+# Attempts per Claude call (only transient failures are retried)
+_MAX_ATTEMPTS = 3
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    """Whether an API error is a rate-limit response."""
+    return "rate limit" in str(error).lower() or "429" in str(error)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether an API error is worth retrying: rate limits, 5xx/529 overloads and dropped connections."""
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, anthropic.APIConnectionError) or _is_rate_limit(error)
+
+# Descriptions up to this length are tried on ANTHROPIC_MODEL_FAST first
+_FAST_MODEL_MAX_DESCRIPTION_LENGTH = 300
+
+# Faker methods known to work with the parameter checks in _validate_schema
+_VALID_FAKER_METHODS: frozenset = frozenset({
+    "name", "first_name", "last_name", "email", "phone_number", "address",
+    "city", "country", "date", "date_between", "text", "sentence", "paragraph",
+    "random_int", "random_element", "boolean", "pydecimal", "uuid4", "url",
+    "company", "job", "ssn", "credit_card_number", "iban"
+})
+
+# First "{" to last "}" of a response, i.e. the schema object without any fences
+_JSON_OBJECT_RE = re.compile(rb"\{.*\}", re.DOTALL)
+
+# Static part of the schema prompt, sent first and shared by every request;
+# the per-request description follows as a separate block
+_STATIC_PROMPT_PREFIX = """You are a data schema generator. Create a JSON schema for synthetic data generation using Python Faker library.
+
+Generate a JSON object with the following structure:
+{
+    "domain": "category_name",
+    "fields": {
+        "field_name_1": {
+            "faker_method": "method_name",
+            "parameters": {},
+            "description": "field description"
+        },
+        "field_name_2": {
+            "faker_method": "method_name",
+            "parameters": {},
+            "description": "field description"
+        }
+    }
+}
+
+Requirements:
+1. Use only valid Faker methods (e.g., "name", "email", "address", "phone_number", "date", "text", "random_int", etc.)
+2. Include 3-15 relevant fields based on the description
+3. Set appropriate parameters for each Faker method
+4. Infer the domain category (e.g., "ecommerce", "healthcare", "finance", "education", "social_media")
+5. Ensure field names are descriptive and snake_case
+6. Return ONLY the JSON object, no additional text
+
+Example:
+{
+    "domain": "ecommerce",
+    "fields": {
+        "customer_name": {
+            "faker_method": "name",
+            "parameters": {},
+            "description": "Customer full name"
+        },
+        "email": {
+            "faker_method": "email",
+            "parameters": {},
+            "description": "Customer email address"
+        },
+        "order_total": {
+            "faker_method": "pydecimal",
+            "parameters": {"left_digits": 3, "right_digits": 2, "positive": true},
+            "description": "Order total amount"
+        }
+    }
+}"""
+
+# Built once and shared by every request (the SDK serializes without mutating it).
+# No cache_control marker: the prefix is ~400 tokens, below the minimum cacheable
+# prompt (1024 tokens on Sonnet, 2048 on Haiku), so the API would ignore it.
+_STATIC_PROMPT_BLOCK: Dict[str, Any] = {
+    "type": "text",
+    "text": _STATIC_PROMPT_PREFIX
+}
 
 
 class AnthropicSchemaGenerator:
     """Service for generating Faker-compatible schemas using Anthropic Claude."""
 
+    # Fixed attribute set: slot access on the rate-limit hot path and no
+    # silently created attributes from typos
+    __slots__ = (
+        "client",
+        "model",
+        "max_tokens",
+        "temperature",
+        "cache",
+        "_request_times",
+        "_daily_request_count",
+        "_day_ends_at",
+        "_in_flight",
+    )
+
     def __init__(self) -> None:
         """Initialize the schema generator with Anthropic client."""
         settings.validate_settings()
         self.client = AsyncAnthropic(
             api_key=settings.ANTHROPIC_API_KEY,
-            timeout=settings.API_REQUEST_TIMEOUT
+            timeout=settings.API_REQUEST_TIMEOUT,
+            max_retries=0  # retries are handled by _call_claude
         )
         self.model = settings.ANTHROPIC_MODEL
         self.max_tokens = settings.ANTHROPIC_MAX_TOKENS
@@ -37,7 +152,7 @@ class AnthropicSchemaGenerator:
         # Initialize cache service
         if settings.CACHE_ENABLED:
             try:
-                self.cache = SchemaCache()
+                self.cache = get_schema_cache()
             except Exception:
                 # Cache initialization failed, disable caching
                 self.cache = None
@@ -45,9 +160,14 @@ class AnthropicSchemaGenerator:
             self.cache = None
 
         # Rate limiting tracking
-        self._request_times: list = []
+        # Monotonic timestamps of requests in the last minute; bounded by the limit
+        self._request_times: deque = deque(maxlen=max(1, settings.RATE_LIMIT_REQUESTS_PER_MINUTE))
         self._daily_request_count = 0
-        self._last_reset_date = datetime.now().date()
+        self._day_ends_at = _next_local_midnight()
+
+        # Generations in progress, keyed by description hash, so concurrent
+        # identical requests share one Claude call
+        self._in_flight: Dict[str, asyncio.Task] = {}
 
     def _check_rate_limits(self) -> None:
         """
@@ -56,12 +176,10 @@ class AnthropicSchemaGenerator:
         Raises:
             RateLimitError: If rate limits would be exceeded
         """
-        now = datetime.now()
-
-        # Reset daily counter if new day
-        if now.date() > self._last_reset_date:
+        # Reset daily counter if new day (fixed window); one clock read per call
+        if time.time() >= self._day_ends_at:
             self._daily_request_count = 0
-            self._last_reset_date = now.date()
+            self._day_ends_at = _next_local_midnight()
 
         # Check daily limit
         if self._daily_request_count >= settings.RATE_LIMIT_REQUESTS_PER_DAY:
@@ -70,9 +188,11 @@ class AnthropicSchemaGenerator:
                 "Try again tomorrow."
             )
 
-        # Clean old request times (older than 1 minute)
-        cutoff_time = now.timestamp() - 60
-        self._request_times = [t for t in self._request_times if t > cutoff_time]
+        # Drop request times older than 1 minute (oldest are on the left)
+        cutoff_time = time.monotonic() - 60
+        request_times = self._request_times
+        while request_times and request_times[0] <= cutoff_time:
+            request_times.popleft()
 
         # Check per-minute limit
         if len(self._request_times) >= settings.RATE_LIMIT_REQUESTS_PER_MINUTE:
@@ -83,71 +203,29 @@ class AnthropicSchemaGenerator:
 
     def _record_request(self) -> None:
         """Record a successful request for rate limiting."""
-        self._request_times.append(time.time())
+        self._request_times.append(time.monotonic())
         self._daily_request_count += 1
 
-    def _create_prompt(self, description: str) -> str:
+    def _create_prompt(self, description: str) -> List[Dict[str, Any]]:
         """
         Create a structured prompt for schema generation.
 
+        The static instructions come first as a prebuilt block; only the
+        short user-request suffix is built per call.
+
         Args:
             description: User's dataset description
 
         Returns:
-            str: Formatted prompt for Claude
+            list: Message content blocks for Claude
         """
-        prompt = f"""You are a data schema generator. Create a JSON schema for synthetic data generation using Python Faker library.
-
-User Request: "{description}"
-
-Generate a JSON object with the following structure:
-{{
-    "domain": "category_name",
-    "fields": {{
-        "field_name_1": {{
-            "faker_method": "method_name",
-            "parameters": {{}},
-            "description": "field description"
-        }},
-        "field_name_2": {{
-            "faker_method": "method_name",
-            "parameters": {{}},
-            "description": "field description"
-        }}
-    }}
-}}
-
-Requirements:
-1. Use only valid Faker methods (e.g., "name", "email", "address", "phone_number", "date", "text", "random_int", etc.)
-2. Include 3-15 relevant fields based on the description
-3. Set appropriate parameters for each Faker method
-4. Infer the domain category (e.g., "ecommerce", "healthcare", "finance", "education", "social_media")
-5. Ensure field names are descriptive and snake_case
-6. Return ONLY the JSON object, no additional text
-
-Example:
-{{
-    "domain": "ecommerce",
-    "fields": {{
-        "customer_name": {{
-            "faker_method": "name",
-            "parameters": {{}},
-            "description": "Customer full name"
-        }},
-        "email": {{
-            "faker_method": "email",
-            "parameters": {{}},
-            "description": "Customer email address"
-        }},
-        "order_total": {{
-            "faker_method": "pydecimal",
-            "parameters": {{"left_digits": 3, "right_digits": 2, "positive": true}},
-            "description": "Order total amount"
-        }}
-    }}
-}}"""
-
-        return prompt
+        return [
+            _STATIC_PROMPT_BLOCK,
+            {
+                "type": "text",
+                "text": f'User Request: "{description}"'
+            }
+        ]
 
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """
@@ -163,17 +241,13 @@ Example:
             ParsingError: If response cannot be parsed
         """
         try:
-            # Clean response text
-            cleaned_text = response_text.strip()
-
-            # Remove markdown code blocks if present
-            if cleaned_text.startswith("```json"):
-                cleaned_text = cleaned_text.replace("```json", "").replace("```", "").strip()
-            elif cleaned_text.startswith("```"):
-                cleaned_text = cleaned_text.replace("```", "").strip()
+            # Slice out the outermost JSON object (skips markdown fences or chatter)
+            match = _JSON_OBJECT_RE.search(response_text.encode("utf-8"))
+            if match is None:
+                raise ParsingError("Response does not contain a JSON object")
 
             # Parse JSON
-            schema_data = json.loads(cleaned_text)
+            schema_data = orjson.loads(match.group(0))
 
             # Validate required fields
             if not isinstance(schema_data, dict):
@@ -187,7 +261,7 @@ Example:
 
             return schema_data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ParsingError(f"Invalid JSON in Claude response: {str(e)}")
         except Exception as e:
             raise ParsingError(f"Failed to parse Claude response: {str(e)}")
@@ -205,13 +279,6 @@ Example:
         Raises:
             ValidationError: If schema is invalid
         """
-        required_faker_methods = {
-            "name", "first_name", "last_name", "email", "phone_number", "address",
-            "city", "country", "date", "date_between", "text", "sentence", "paragraph",
-            "random_int", "random_element", "boolean", "pydecimal", "uuid4", "url",
-            "company", "job", "ssn", "credit_card_number", "iban"
-        }
-
         for field_name, field_config in schema["fields"].items():
             if not isinstance(field_config, dict):
                 raise ValidationError(f"Field '{field_name}' configuration must be a dictionary")
@@ -220,7 +287,7 @@ Example:
                 raise ValidationError(f"Field '{field_name}' missing 'faker_method'")
 
             faker_method = field_config["faker_method"]
-            if faker_method not in required_faker_methods:
+            if faker_method not in _VALID_FAKER_METHODS:
                 # Allow method but warn it might not work
                 continue
 
@@ -230,6 +297,177 @@ Example:
 
         return True
 
+    def _message_params(self, description: str, model: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the Messages API parameters for a description.
+
+        Args:
+            description: User's dataset description
+            model: Model to use instead of the configured ANTHROPIC_MODEL
+
+        Returns:
+            dict: Keyword arguments for messages.stream (also used as batch params)
+        """
+        return {
+            "model": model or self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": self._create_prompt(description)
+                }
+            ]
+        }
+
+    def _build_schema(self, description_hash: str, response_text: str) -> GeneratedSchema:
+        """
+        Parse and validate Claude's response into a GeneratedSchema.
+
+        Args:
+            description_hash: Hash of the description the response belongs to
+            response_text: Raw response text from Claude
+
+        Returns:
+            GeneratedSchema built from the response
+
+        Raises:
+            SchemaGenerationError: If the response is empty
+            ParsingError: If the response cannot be parsed
+            ValidationError: If the schema is invalid
+        """
+        if not response_text:
+            raise SchemaGenerationError("Claude returned empty response")
+
+        schema_data = self._parse_response(response_text)
+
+        # Validate schema
+        self._validate_schema(schema_data)
+
+        return GeneratedSchema(
+            description_hash=description_hash,
+            fields_schema=schema_data["fields"],
+            created_at=datetime.now(),
+            domain=schema_data.get("domain", "unknown")
+        )
+
+    async def _stream_text(self, params: Dict[str, Any]) -> str:
+        """
+        Stream a Messages API response until the top-level JSON object closes.
+
+        Braces are tracked outside JSON strings, so the stream is closed as
+        soon as the schema object is complete instead of waiting for any
+        trailing tokens (closing fences, commentary).
+
+        Args:
+            params: Keyword arguments for messages.stream
+
+        Returns:
+            str: Response text received so far
+        """
+        parts: List[str] = []
+        depth = 0
+        in_string = escaped = False
+
+        async with self.client.messages.stream(**params) as stream:
+            async for text in stream.text_stream:
+                parts.append(text)
+                for char in text:
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif char == "\\":
+                            escaped = True
+                        elif char == '"':
+                            in_string = False
+                    elif char == '"' and depth:
+                        in_string = True
+                    elif char == "{":
+                        depth += 1
+                    elif char == "}" and depth:
+                        depth -= 1
+                        if not depth:
+                            return "".join(parts)
+
+        return "".join(parts)
+
+    async def _call_claude(self, params: Dict[str, Any]) -> str:
+        """
+        Call the Messages API (streaming) with a hard per-attempt deadline.
+
+        The SDK's own retries are disabled, so transient failures (rate
+        limits, 5xx and 529 overloaded responses, dropped connections) are
+        retried here with jittered exponential backoff (0.5s doubling, capped
+        at 4s). Deadline overruns and other errors fail immediately so the
+        caller's wait stays bounded.
+
+        Args:
+            params: Keyword arguments for messages.create
+
+        Returns:
+            str: Claude response text
+
+        Raises:
+            RateLimitError: If still rate limited after all attempts
+            APIConnectionError: On timeout or any other API failure
+        """
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return await asyncio.wait_for(
+                    self._stream_text(params),
+                    timeout=settings.API_REQUEST_TIMEOUT
+                )
+
+            except asyncio.TimeoutError:
+                raise APIConnectionError(
+                    f"Request timeout: no response within {settings.API_REQUEST_TIMEOUT}s"
+                )
+
+            except Exception as e:
+                if _is_transient(e) and attempt < _MAX_ATTEMPTS - 1:
+                    await asyncio.sleep(min(4.0, 0.5 * 2 ** attempt + random.uniform(0, 1)))
+                    continue
+                if _is_rate_limit(e):
+                    raise RateLimitError(f"Rate limit exceeded: {str(e)}")
+                elif "timeout" in str(e).lower():
+                    raise APIConnectionError(f"Request timeout: {str(e)}")
+                else:
+                    raise APIConnectionError(f"Anthropic API error: {str(e)}")
+
+    async def _generate_with_model(
+        self, description: str, description_hash: str, model: str, record_request: bool = True
+    ) -> GeneratedSchema:
+        """
+        Call Claude with the given model and build the resulting schema.
+
+        Rate limits are checked by the caller, once per generation.
+
+        Args:
+            description: User's dataset description
+            description_hash: Hash of the description
+            model: Model name to call
+            record_request: Whether a successful call takes a rate-limit slot
+                (False for a fallback call within an already recorded generation)
+
+        Returns:
+            GeneratedSchema built from the response
+
+        Raises:
+            RateLimitError: If the upstream rate limit is hit
+            APIConnectionError: On timeout or API failure
+            ParsingError: If the response cannot be parsed
+            ValidationError: If the schema is invalid
+        """
+        # Make Claude API call with retry logic
+        response_text = await self._call_claude(self._message_params(description, model))
+
+        # Record successful request
+        if record_request:
+            self._record_request()
+
+        # Parse and validate response into a GeneratedSchema
+        return self._build_schema(description_hash, response_text)
+
     def _generate_hash(self, description: str) -> str:
         """Generate SHA-256 hash of description for caching."""
         return generate_cache_key(description)
@@ -238,6 +476,8 @@ Example:
         """
         Generate a Faker-compatible schema from natural language description.
 
+        Concurrent calls with the same description await a single generation.
+
         Args:
             description: Natural language description of dataset needs
 
@@ -257,10 +497,34 @@ Example:
         # Generate description hash for caching
         description_hash = self._generate_hash(description)
 
+        # Join an identical generation that is already running
+        task = self._in_flight.get(description_hash)
+        if task is None:
+            task = asyncio.ensure_future(self._generate_schema(description, description_hash))
+            self._in_flight[description_hash] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(description_hash, None))
+
+        # Shield so one caller disconnecting does not cancel the others' result
+        return await asyncio.shield(task)
+
+    async def _generate_schema(self, description: str, description_hash: str) -> GeneratedSchema:
+        """
+        Look up or generate the schema for a validated description.
+
+        Args:
+            description: Natural language description of dataset needs
+            description_hash: Cache key of the description
+
+        Returns:
+            GeneratedSchema object with generated schema and metadata
+        """
         # Check cache first if caching is enabled
         if self.cache:
             try:
-                cached_schema = self.cache.get_cached_schema(description_hash)
+                cached_schema = (
+                    self.cache.get_memory_cached_schema(description_hash)
+                    or await asyncio.to_thread(self.cache.get_cached_schema, description_hash)
+                )
                 if cached_schema:
                     # Cache hit! Return cached schema
                     return cached_schema
@@ -268,70 +532,56 @@ Example:
                 # Cache error shouldn't block schema generation
                 pass
 
-        # Cache miss or caching disabled - proceed with Claude generation
-        # Check rate limits
-        self._check_rate_limits()
+        # Exact miss - look for a paraphrase of an earlier description
+        embedding = None
+        if self.cache:
+            try:
+                embedding = await asyncio.to_thread(embed_description, description)
+                if embedding is not None:
+                    similar_schema = await asyncio.to_thread(self.cache.get_similar, embedding)
+                    if similar_schema:
+                        # Re-key under this description so the next call hits the exact path
+                        similar_schema = similar_schema.model_copy(
+                            update={"description_hash": description_hash}
+                        )
+                        await asyncio.to_thread(self.cache.save_schema, description_hash, similar_schema)
+                        return similar_schema
+            except Exception:
+                # Semantic lookup is best-effort
+                pass
 
+        # Cache miss or caching disabled - proceed with Claude generation
         try:
-            # Create prompt
-            prompt = self._create_prompt(description)
+            # One generation takes one rate-limit slot, even when it falls back
+            # from the fast model to the main one
+            self._check_rate_limits()
+
+            generated_schema = None
+            recorded = False
 
-            # Make Claude API call with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
+            # Short descriptions go to the fast model first
+            fast_model = settings.ANTHROPIC_MODEL_FAST
+            if fast_model and len(description) <= _FAST_MODEL_MAX_DESCRIPTION_LENGTH:
                 try:
-                    response = await self.client.messages.create(
-                        model=self.model,
-                        max_tokens=self.max_tokens,
-                        temperature=self.temperature,
-                        messages=[
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ]
+                    generated_schema = await self._generate_with_model(
+                        description, description_hash, fast_model
                     )
-                    break
-
-                except Exception as e:
-                    if "rate limit" in str(e).lower() or "429" in str(e):
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                            continue
-                        else:
-                            raise RateLimitError(f"Rate limit exceeded: {str(e)}")
-                    elif "timeout" in str(e).lower():
-                        raise APIConnectionError(f"Request timeout: {str(e)}")
-                    else:
-                        raise APIConnectionError(f"Anthropic API error: {str(e)}")
-
-            # Record successful request
-            self._record_request()
-
-            # Parse response
-            response_text = response.content[0].text
-            if not response_text:
-                raise SchemaGenerationError("Claude returned empty response")
-
-            schema_data = self._parse_response(response_text)
+                except (ParsingError, ValidationError):
+                    # Unusable schema - escalate to the main model; the fast
+                    # call succeeded upstream, so its slot is already recorded
+                    recorded = True
 
-            # Validate schema
-            self._validate_schema(schema_data)
-
-            # Create GeneratedSchema object
-            domain = schema_data.get("domain", "unknown")
-
-            generated_schema = GeneratedSchema(
-                description_hash=description_hash,
-                fields_schema=schema_data["fields"],
-                created_at=datetime.now(),
-                domain=domain
-            )
+            if generated_schema is None:
+                generated_schema = await self._generate_with_model(
+                    description, description_hash, self.model, record_request=not recorded
+                )
 
             # Save to cache if caching is enabled
             if self.cache:
                 try:
-                    self.cache.save_schema(description_hash, generated_schema)
+                    await asyncio.to_thread(self.cache.save_schema, description_hash, generated_schema)
+                    if embedding is not None:
+                        await asyncio.to_thread(self.cache.save_embedding, description_hash, embedding)
                 except Exception:
                     # Cache save error shouldn't block response
                     pass
@@ -344,3 +594,141 @@ Example:
         except Exception as e:
             # Never log the API key or sensitive information
             raise SchemaGenerationError(f"Schema generation failed: {str(e)}")
+
+    async def generate_schema_batch(
+        self, descriptions: List[str]
+    ) -> Dict[str, Union[GeneratedSchema, BaseServiceException]]:
+        """
+        Generate schemas for many descriptions through the Message Batches API.
+
+        Batched requests are billed at half price but may take up to 24 hours,
+        so this is meant for queued/offline workloads; interactive callers
+        should keep using generate_schema. Cached descriptions are answered
+        from the cache, and every new schema is saved to it. Without
+        USE_BATCH_API the descriptions are generated one by one instead.
+
+        Args:
+            descriptions: Natural language descriptions of dataset needs
+
+        Returns:
+            Mapping of every description to its GeneratedSchema, or to the
+            exception explaining why its request failed (errored, expired or
+            unparseable entries; failures are not cached).
+
+        Raises:
+            ValidationError: If any description has an invalid length
+            RateLimitError: If submitting the batch would exceed rate limits
+            APIConnectionError: If the Batches API cannot be reached or the
+                batch has not ended within BATCH_TIMEOUT_SECONDS
+        """
+        for description in descriptions:
+            if len(description) < settings.MIN_DESCRIPTION_LENGTH:
+                raise ValidationError(f"Description must be at least {settings.MIN_DESCRIPTION_LENGTH} characters")
+            if len(description) > settings.MAX_DESCRIPTION_LENGTH:
+                raise ValidationError(f"Description must be less than {settings.MAX_DESCRIPTION_LENGTH} characters")
+
+        results: Dict[str, Union[GeneratedSchema, BaseServiceException]] = {}
+
+        if not settings.USE_BATCH_API:
+            for description in descriptions:
+                try:
+                    results[description] = await self.generate_schema(description)
+                except RateLimitError:
+                    raise
+                except BaseServiceException as e:
+                    results[description] = e
+            return results
+
+        # Resolve cache hits and de-duplicate by hash; the hash is the batch custom_id
+        pending: Dict[str, List[str]] = {}
+        for description in descriptions:
+            description_hash = self._generate_hash(description)
+            cached_schema = None
+            if self.cache:
+                try:
+                    cached_schema = await asyncio.to_thread(self.cache.get_cached_schema, description_hash)
+                except Exception:
+                    # Cache error shouldn't block schema generation
+                    pass
+            if cached_schema:
+                results[description] = cached_schema
+            else:
+                pending.setdefault(description_hash, []).append(description)
+
+        if not pending:
+            return results
+
+        self._check_rate_limits()
+
+        try:
+            batch = await self.client.messages.batches.create(
+                requests=[
+                    {"custom_id": description_hash, "params": self._message_params(batch_descriptions[0])}
+                    for description_hash, batch_descriptions in pending.items()
+                ]
+            )
+            self._record_request()
+
+            # Poll with exponential backoff until the batch has ended or the deadline passes
+            deadline = time.monotonic() + settings.BATCH_TIMEOUT_SECONDS
+            delay = settings.BATCH_POLL_INITIAL_SECONDS
+            while batch.processing_status != "ended":
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    try:
+                        await self.client.messages.batches.cancel(batch.id)
+                    except Exception:
+                        # The timeout is reported either way
+                        pass
+                    raise APIConnectionError(
+                        f"Request timeout: batch {batch.id} did not end within "
+                        f"{settings.BATCH_TIMEOUT_SECONDS}s"
+                    )
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 2, settings.BATCH_POLL_MAX_SECONDS)
+                batch = await self.client.messages.batches.retrieve(batch.id)
+
+            entries = await self.client.messages.batches.results(batch.id)
+            async for entry in entries:
+                if entry.custom_id not in pending:
+                    continue
+                if entry.result.type != "succeeded":
+                    # errored, canceled or expired
+                    detail = getattr(entry.result, "error", None)
+                    error = SchemaGenerationError(
+                        f"Batch request {entry.result.type}" + (f": {detail}" if detail else "")
+                    )
+                    for description in pending[entry.custom_id]:
+                        results[description] = error
+                    continue
+                try:
+                    generated_schema = self._build_schema(
+                        entry.custom_id, entry.result.message.content[0].text
+                    )
+                except (SchemaGenerationError, ParsingError, ValidationError) as e:
+                    # One bad response shouldn't discard the rest of the batch
+                    for description in pending[entry.custom_id]:
+                        results[description] = e
+                    continue
+
+                if self.cache:
+                    try:
+                        await asyncio.to_thread(self.cache.save_schema, entry.custom_id, generated_schema)
+                    except Exception:
+                        # Cache save error shouldn't block response
+                        pass
+
+                for description in pending[entry.custom_id]:
+                    results[description] = generated_schema
+
+        except (RateLimitError, APIConnectionError):
+            raise
+        except Exception as e:
+            raise APIConnectionError(f"Anthropic Batches API error: {str(e)}")
+
+        # Requests the batch returned no result for
+        for batch_descriptions in pending.values():
+            for description in batch_descriptions:
+                results.setdefault(description, SchemaGenerationError("Batch returned no result for this request"))
+
+        return results
@@ -1,54 +1,249 @@
 """Schema caching service for persistent storage of generated schemas."""
 
+import atexit
+import functools
 import json
+import os
+import struct
+import threading
+import weakref
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import asdict
 
+import orjson
+
 from src.core.config import settings
 from src.core.exceptions import CacheError
 from src.api.models import GeneratedSchema
 from src.utils.file_operations import (
     read_json_file,
     write_json_file,
-    ensure_file_exists,
+    fsync_files,
+    append_json_lines,
+    read_json_lines,
     get_file_size
 )
 from src.utils.hash_utils import validate_hash
 
 
+# Embedding log record header: description hash (64 hex chars) and vector
+# length; the float32 little-endian vector follows
+_EMBEDDING_RECORD_HEADER = struct.Struct("<64sI")
+
+
+def _encode_embedding_record(description_hash: str, vector: Any) -> bytes:
+    """Serialize one embedding as an append-log record."""
+    return _EMBEDDING_RECORD_HEADER.pack(description_hash.encode("ascii"), vector.shape[0]) + vector.astype("<f4").tobytes()
+
+
+def _decode_embedding_records(data: bytes) -> Tuple[List[Tuple[str, Any]], int]:
+    """
+    Parse an embedding append log, stopping at a torn or damaged record.
+    
+    Args:
+        data: Raw log contents
+        
+    Returns:
+        Tuple of the (hash, vector) records and the byte length they span
+    """
+    import numpy as np
+    
+    records: List[Tuple[str, Any]] = []
+    offset = 0
+    while offset + _EMBEDDING_RECORD_HEADER.size <= len(data):
+        raw_hash, dimension = _EMBEDDING_RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _EMBEDDING_RECORD_HEADER.size
+        end = start + 4 * dimension
+        if end > len(data) or not validate_hash(raw_hash.decode("ascii", errors="replace")):
+            break
+        records.append((raw_hash.decode("ascii"), np.frombuffer(data, dtype="<f4", count=dimension, offset=start)))
+        offset = end
+    return records, offset
+
+
+# Caches with writes that may still be queued; flushed at interpreter exit
+_live_caches: "weakref.WeakSet[SchemaCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_caches() -> None:
+    """Write out queued schemas of every cache before the process exits."""
+    for cache in list(_live_caches):
+        try:
+            cache.flush()
+        except CacheError:
+            pass
+
+
 class SchemaCache:
-    """File-based cache for generated schemas with atomic operations."""
+    """
+    File-based cache for generated schemas with atomic operations.
+    
+    Each schema lives in its own ``<hash>.json`` under CACHE_DIR, so a lookup or
+    insert touches one small file regardless of cache size. ``index.jsonl`` is
+    an append-only log of inserts from which the statistics are derived.
+    """
+    
+    # Schemas kept in the in-process LRU in front of the cache files (a few KB each)
+    MEMORY_CACHE_SIZE = 1024
+    
+    INDEX_FILE_NAME = "index.jsonl"
+    
+    # Group commit: queued saves are written together after at most this
+    # delay, or as soon as this many are waiting
+    FLUSH_INTERVAL_SECONDS = 0.05
+    FLUSH_BATCH_SIZE = 64
+    
+    # Appended embeddings are folded into the .npz snapshot once the log holds
+    # at least this many records and at least as many as the snapshot
+    EMBEDDING_LOG_COMPACT_MIN = 64
     
     def __init__(self) -> None:
         """Initialize the schema cache with file paths."""
+        self.cache_dir = Path(settings.CACHE_DIR)
+        self.index_file = self.cache_dir / self.INDEX_FILE_NAME
         self.cache_file = Path(settings.CACHE_FILE_PATH)
         self.backup_file = Path(settings.CACHE_BACKUP_PATH)
+        self.embedding_file = Path(settings.SEMANTIC_CACHE_PATH)
+        # Embeddings saved since the last .npz snapshot, as fixed-layout records
+        self.embedding_log = self.embedding_file.with_suffix(".log")
+        
+        # Semantic index (hashes + normalized embedding rows), loaded under
+        # _write_lock on first use and only published once complete. The buffer
+        # grows by doubling; its first len(_embedding_hashes) rows are live.
+        self._embedding_loaded = False
+        self._embedding_hashes: List[str] = []
+        self._embedding_rows: Dict[str, int] = {}
+        self._embedding_buffer: Optional[Any] = None
+        self._embedding_snapshot_rows = 0
+        self._embedding_log_records = 0
         
-        # Ensure data directory exists
-        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Serializes cache updates from worker threads
+        self._write_lock = threading.Lock()
         
-        # Initialize cache file if it doesn't exist
+        # In-process LRU of recently used schemas, keyed by description hash
+        self._memory: "OrderedDict[str, GeneratedSchema]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        
+        # Saves not yet written to disk, drained by a background flusher thread
+        self._pending: Dict[str, GeneratedSchema] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        
+        # In-memory view of index.jsonl (hash -> last update, first insert first),
+        # kept current by parsing only the lines appended since the last refresh
+        self._index: Dict[str, str] = {}
+        self._index_last_updated: Optional[str] = None
+        self._index_lines = 0
+        self._index_offset = 0
+        self._index_inode: Optional[int] = None
+        
+        # Create the cache directory and index if they don't exist
         self._initialize_cache()
     
+    def _schema_path(self, description_hash: str) -> Path:
+        """Path of the file holding one cached schema."""
+        return self.cache_dir / f"{description_hash}.json"
+    
     def _initialize_cache(self) -> None:
-        """Initialize the cache file with empty structure if it doesn't exist."""
-        default_cache = {
-            "version": "1.0",
-            "created_at": datetime.now().isoformat(),
-            "schemas": {},
-            "metadata": {
-                "total_schemas": 0,
-                "last_updated": datetime.now().isoformat()
-            }
-        }
-        
+        """Create the cache directory and index, importing a legacy single-file cache once."""
         try:
-            ensure_file_exists(self.cache_file, default_cache)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if not self.index_file.exists():
+                self._import_legacy_cache()
         except OSError as e:
             raise CacheError(f"Failed to initialize cache file: {str(e)}")
     
+    def _import_legacy_cache(self) -> None:
+        """
+        Split schemas from a pre-existing CACHE_FILE_PATH into per-schema files.
+        
+        The index is written last, so an interrupted import is simply redone.
+        """
+        schemas: Dict[str, Any] = {}
+        if self.cache_file.exists():
+            try:
+                schemas = read_json_file(self.cache_file).get("schemas", {})
+            except (json.JSONDecodeError, OSError):
+                schemas = {}
+        
+        entries = {}
+        now = datetime.now().isoformat()
+        for description_hash, schema_data in schemas.items():
+            if validate_hash(description_hash):
+                write_json_file(self._schema_path(description_hash), schema_data)
+                entries[description_hash] = now
+        
+        self._rewrite_index(entries)
+    
+    def _rewrite_index(self, entries: Dict[str, str]) -> int:
+        """
+        Replace index.jsonl with one line per hash.
+        
+        Written to a temp file and renamed, so the index is never seen half-written.
+        
+        Args:
+            entries: Last update time per description hash, in index order
+            
+        Returns:
+            int: Size of the new index in bytes
+        """
+        payload = b"".join(
+            orjson.dumps({"hash": description_hash, "updated_at": updated_at}, option=orjson.OPT_APPEND_NEWLINE)
+            for description_hash, updated_at in entries.items()
+        )
+        temp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        with open(temp_file, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.index_file)
+        return len(payload)
+    
+    def _refresh_index_locked(self) -> None:
+        """
+        Bring the in-memory index up to date with index.jsonl; caller holds _write_lock.
+        
+        Raises:
+            FileNotFoundError: If the index does not exist
+            json.JSONDecodeError: If an appended line is not valid JSON
+        """
+        stat = os.stat(self.index_file)
+        if stat.st_ino != self._index_inode or stat.st_size < self._index_offset:
+            # Replaced or truncated (compaction, clear_cache, another process): reload
+            self._index = {}
+            self._index_last_updated = None
+            self._index_lines = 0
+            self._index_offset = 0
+            self._index_inode = stat.st_ino
+        
+        if stat.st_size > self._index_offset:
+            entries, self._index_offset = read_json_lines(self.index_file, self._index_offset)
+            for entry in entries:
+                self._index[entry["hash"]] = entry["updated_at"]
+            if entries:
+                self._index_last_updated = entries[-1]["updated_at"]
+            self._index_lines += len(entries)
+    
+    def _compact_index_locked(self) -> None:
+        """
+        Drop superseded index lines once they outnumber the live ones; caller holds _write_lock.
+        
+        Rewriting only when the log has doubled keeps compaction amortized O(1)
+        per insert. Lines another process appends while the index is being
+        rewritten can drop out of it; their schema files are unaffected.
+        """
+        if self._index_lines <= 2 * len(self._index):
+            return
+        
+        self._index_offset = self._rewrite_index(self._index)
+        self._index_inode = os.stat(self.index_file).st_ino
+        self._index_lines = len(self._index)
+    
     def get_cached_schema(self, description_hash: str) -> Optional[GeneratedSchema]:
         """
         Retrieve a cached schema by description hash.
@@ -65,73 +260,163 @@ class SchemaCache:
         if not validate_hash(description_hash):
             raise ValueError(f"Invalid hash format: {description_hash}")
         
+        cached_schema = self.get_memory_cached_schema(description_hash)
+        if cached_schema is not None:
+            return cached_schema
+        
         try:
-            cache_data = read_json_file(self.cache_file)
-            schemas = cache_data.get("schemas", {})
-            
-            if description_hash not in schemas:
-                return None
-            
-            schema_data = schemas[description_hash]
+            schema_data = read_json_file(self._schema_path(description_hash))
             
             # Convert back to GeneratedSchema object
-            return GeneratedSchema(
+            schema = GeneratedSchema(
                 description_hash=schema_data["description_hash"],
                 fields_schema=schema_data["fields_schema"],
                 created_at=datetime.fromisoformat(schema_data["created_at"]),
                 domain=schema_data["domain"]
             )
+            self._remember(description_hash, schema)
+            return schema
             
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            # Try to recover from backup if main cache is corrupted
-            return self._recover_from_backup(description_hash)
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            # A damaged entry is a miss; the next save_schema rewrites it
+            return None
         except (KeyError, ValueError, TypeError) as e:
             raise CacheError(f"Invalid cache data format: {str(e)}")
         except OSError as e:
             raise CacheError(f"Failed to read cache file: {str(e)}")
     
+    def get_memory_cached_schema(self, description_hash: str) -> Optional[GeneratedSchema]:
+        """
+        Look up a schema in the in-process LRU only.
+        
+        Does no file I/O, so it is safe to call directly from async code
+        before falling back to get_cached_schema in a worker thread.
+        
+        Args:
+            description_hash: SHA-256 hash of the description
+            
+        Returns:
+            GeneratedSchema object if recently used, None otherwise
+        """
+        with self._memory_lock:
+            schema = self._memory.get(description_hash)
+            if schema is not None:
+                self._memory.move_to_end(description_hash)
+                return schema
+        
+        # Evicted from the LRU before its queued write reached disk
+        with self._pending_lock:
+            return self._pending.get(description_hash)
+    
+    def _remember(self, description_hash: str, schema: GeneratedSchema) -> None:
+        """Insert a schema into the in-process LRU, evicting the oldest entry."""
+        with self._memory_lock:
+            self._memory[description_hash] = schema
+            self._memory.move_to_end(description_hash)
+            if len(self._memory) > self.MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+    
     def save_schema(self, description_hash: str, schema: GeneratedSchema) -> bool:
         """
         Save a schema to the cache.
         
+        The schema is served from memory immediately and queued for a
+        background group write; call flush() to wait for it to reach disk.
+        
         Args:
             description_hash: SHA-256 hash of the description
             schema: GeneratedSchema object to cache
             
         Returns:
-            bool: True if successfully saved
-            
-        Raises:
-            CacheError: If cache cannot be updated
+            bool: True if the schema was accepted
         """
         if not validate_hash(description_hash):
             raise ValueError(f"Invalid hash format: {description_hash}")
         
-        try:
-            # Read current cache data
-            cache_data = read_json_file(self.cache_file)
-            
-            # Add new schema
-            cache_data["schemas"][description_hash] = {
-                "description_hash": schema.description_hash,
-                "fields_schema": schema.fields_schema,
-                "created_at": schema.created_at.isoformat(),
-                "domain": schema.domain
-            }
+        self._remember(description_hash, schema)
+        with self._pending_lock:
+            self._pending[description_hash] = schema
+            if len(self._pending) >= self.FLUSH_BATCH_SIZE:
+                self._flush_requested.set()
+            if self._flusher is None:
+                _live_caches.add(self)
+                self._flusher = threading.Thread(
+                    target=self._run_flusher, name="schema-cache-flusher", daemon=True
+                )
+                self._flusher.start()
+        return True
+    
+    def _run_flusher(self) -> None:
+        """Flush queued saves in batches; exits once the queue is empty."""
+        while True:
+            self._flush_requested.wait(self.FLUSH_INTERVAL_SECONDS)
+            self._flush_requested.clear()
+            try:
+                self.flush()
+            except CacheError:
+                # Disk cache is best-effort; the schemas remain served from memory
+                pass
+            with self._pending_lock:
+                if not self._pending:
+                    self._flusher = None
+                    return
+    
+    def flush(self) -> bool:
+        """
+        Write all queued schemas to disk.
+        
+        Returns:
+            bool: True once the queue has been written
             
-            # Update metadata
-            cache_data["metadata"]["total_schemas"] = len(cache_data["schemas"])
-            cache_data["metadata"]["last_updated"] = datetime.now().isoformat()
+        Raises:
+            CacheError: If the batch cannot be written (it is dropped from the queue)
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, {}
+            if batch:
+                self._save_schemas_locked(batch)
+        return True
+    
+    @staticmethod
+    def _schema_record(schema: GeneratedSchema) -> Dict[str, Any]:
+        """On-disk representation of one cached schema."""
+        return {
+            "description_hash": schema.description_hash,
+            "fields_schema": schema.fields_schema,
+            "created_at": schema.created_at,
+            "domain": schema.domain
+        }
+    
+    def _save_schemas_locked(self, batch: Dict[str, GeneratedSchema]) -> None:
+        """Write one file per schema and log the batch in the index; caller holds _write_lock."""
+        try:
+            # Group commit: the files are written unsynced, then synced in one
+            # pass before the index records their hashes
+            written = []
+            for description_hash, schema in batch.items():
+                schema_path = self._schema_path(description_hash)
+                write_json_file(schema_path, self._schema_record(schema), fsync=False)
+                written.append(schema_path)
+            fsync_files(written)
             
-            # Write updated cache
-            write_json_file(self.cache_file, cache_data, create_backup=True)
-            return True
+            now = datetime.now()
+            append_json_lines(
+                self.index_file,
+                [{"hash": description_hash, "updated_at": now} for description_hash in batch]
+            )
             
-        except (FileNotFoundError, json.JSONDecodeError):
-            # If cache is corrupted, recreate it
-            return self._recreate_cache_with_schema(description_hash, schema)
         except OSError as e:
             raise CacheError(f"Failed to save to cache: {str(e)}")
+        
+        try:
+            self._refresh_index_locked()
+            self._compact_index_locked()
+        except (json.JSONDecodeError, KeyError, OSError):
+            # Index upkeep is best-effort; the schemas themselves are saved
+            pass
     
     def clear_cache(self) -> bool:
         """
@@ -141,36 +426,295 @@ class SchemaCache:
             bool: True if cache was cleared successfully
         """
         try:
-            self._initialize_cache()
+            with self._write_lock:
+                with self._pending_lock:
+                    unsaved, self._pending = self._pending, {}
+                
+                self._snapshot_to_backup_locked(unsaved)
+                
+                # Empty the index first so no reader counts a half-deleted cache
+                self.index_file.write_bytes(b"")
+                self._index = {}
+                self._index_last_updated = None
+                self._index_lines = 0
+                self._index_offset = 0
+                for schema_file in self.cache_dir.glob("*.json"):
+                    schema_file.unlink(missing_ok=True)
+                with self._memory_lock:
+                    self._memory.clear()
+                self.embedding_file.unlink(missing_ok=True)
+                self.embedding_log.unlink(missing_ok=True)
+                self._embedding_hashes = []
+                self._embedding_rows = {}
+                self._embedding_buffer = None
+                self._embedding_snapshot_rows = 0
+                self._embedding_log_records = 0
+                self._embedding_loaded = True
             return True
         except OSError:
             return False
     
+    def _snapshot_to_backup_locked(self, unsaved: Dict[str, GeneratedSchema]) -> None:
+        """
+        Save the schemas about to be cleared to CACHE_BACKUP_PATH; caller holds _write_lock.
+        
+        The snapshot uses the legacy single-file layout, so copying it to
+        CACHE_FILE_PATH and deleting index.jsonl restores it on next start.
+        Best-effort: unreadable entries are skipped.
+        
+        Args:
+            unsaved: Queued schemas that have not been flushed to disk yet
+        """
+        schemas: Dict[str, Any] = {}
+        try:
+            self._refresh_index_locked()
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+        
+        for description_hash in self._index:
+            try:
+                schemas[description_hash] = read_json_file(self._schema_path(description_hash))
+            except (FileNotFoundError, json.JSONDecodeError, OSError):
+                continue
+        
+        for description_hash, schema in unsaved.items():
+            schemas[description_hash] = self._schema_record(schema)
+        
+        write_json_file(
+            self.backup_file,
+            {"version": "1.0", "created_at": datetime.now(), "schemas": schemas}
+        )
+    
+    def get_similar(self, embedding: Any, threshold: Optional[float] = None) -> Optional[GeneratedSchema]:
+        """
+        Retrieve the cached schema whose description is most similar to an embedding.
+        
+        Brute-force inner product over L2-normalized vectors (cosine similarity),
+        which is exact and fast at the size this cache reaches.
+        
+        Args:
+            embedding: L2-normalized description embedding
+            threshold: Minimum cosine similarity for a hit (defaults to
+                SEMANTIC_CACHE_THRESHOLD)
+            
+        Returns:
+            GeneratedSchema of the closest match above threshold, None otherwise
+        """
+        import numpy as np
+        
+        if threshold is None:
+            threshold = settings.SEMANTIC_CACHE_THRESHOLD
+        
+        if not self._embedding_loaded:
+            with self._write_lock:
+                self._load_embedding_index_locked()
+        
+        # Only the similarity read runs without the lock
+        matrix = self._embedding_matrix
+        if matrix is None:
+            return None
+        
+        query = np.asarray(embedding, dtype=np.float32)
+        if query.shape[0] != matrix.shape[1]:
+            return None
+        
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        if scores[best] < threshold:
+            return None
+        
+        return self.get_cached_schema(self._embedding_hashes[best])
+    
+    def save_embedding(self, description_hash: str, embedding: Any) -> bool:
+        """
+        Store a description embedding next to its cached schema.
+        
+        Args:
+            description_hash: SHA-256 hash of the description
+            embedding: L2-normalized description embedding
+            
+        Returns:
+            bool: True if successfully saved
+            
+        Raises:
+            CacheError: If the embedding file cannot be written
+        """
+        import numpy as np
+        
+        if not validate_hash(description_hash):
+            raise ValueError(f"Invalid hash format: {description_hash}")
+        
+        with self._write_lock:
+            return self._save_embedding_locked(description_hash, np.asarray(embedding, dtype=np.float32))
+    
+    def _save_embedding_locked(self, description_hash: str, embedding: Any) -> bool:
+        """
+        Append one embedding to the log and the in-memory index; caller holds _write_lock.
+        
+        Only the new record is written. The .npz snapshot is rewritten once the
+        log has grown as large as it, which keeps the cost amortized O(1) per insert.
+        """
+        self._load_embedding_index_locked()
+        vector = embedding.reshape(-1)
+        
+        try:
+            # Not fsynced: embeddings can be recomputed, and a lost or torn
+            # tail record only costs semantic hits
+            with open(self.embedding_log, "ab") as f:
+                f.write(_encode_embedding_record(description_hash, vector))
+            self._embedding_log_records += 1
+            self._apply_embedding(description_hash, vector)
+            
+            if self._embedding_log_records >= max(self.EMBEDDING_LOG_COMPACT_MIN, self._embedding_snapshot_rows):
+                self._compact_embeddings_locked()
+        except OSError as e:
+            raise CacheError(f"Failed to save embedding: {str(e)}")
+        
+        return True
+    
+    @property
+    def _embedding_matrix(self) -> Optional[Any]:
+        """Live rows of the embedding buffer (a view, not a copy)."""
+        if self._embedding_buffer is None or not self._embedding_hashes:
+            return None
+        return self._embedding_buffer[:len(self._embedding_hashes)]
+    
+    def _apply_embedding(self, description_hash: str, vector: Any) -> None:
+        """Add or replace one row of the in-memory embedding index."""
+        import numpy as np
+        
+        buffer = self._embedding_buffer
+        if buffer is None or buffer.shape[1] != vector.shape[0]:
+            # First entry, or the embedding model changed: start a fresh index
+            self._embedding_hashes = []
+            self._embedding_rows = {}
+            buffer = self._embedding_buffer = np.empty((16, vector.shape[0]), dtype=np.float32)
+        
+        row = self._embedding_rows.get(description_hash)
+        if row is not None:
+            buffer[row] = vector
+            return
+        
+        row = len(self._embedding_hashes)
+        if row == buffer.shape[0]:
+            grown = np.empty((2 * row, buffer.shape[1]), dtype=np.float32)
+            grown[:row] = buffer
+            buffer = self._embedding_buffer = grown
+        # Row first, then hash, so concurrent readers never see a hash without its row
+        buffer[row] = vector
+        self._embedding_rows[description_hash] = row
+        self._embedding_hashes.append(description_hash)
+    
+    def _compact_embeddings_locked(self) -> None:
+        """
+        Fold the embedding log into the .npz snapshot; caller holds _write_lock.
+        
+        Raises:
+            OSError: If the snapshot cannot be written
+        """
+        import numpy as np
+        
+        temp_file = self.embedding_file.with_name(self.embedding_file.name + ".tmp")
+        with open(temp_file, "wb") as f:
+            np.savez(f, hashes=np.array(self._embedding_hashes), embeddings=self._embedding_matrix)
+        os.replace(temp_file, self.embedding_file)
+        
+        # Replaying records that are already in the snapshot is harmless, so a
+        # crash before the log is emptied loses nothing
+        self.embedding_log.write_bytes(b"")
+        self._embedding_snapshot_rows = len(self._embedding_hashes)
+        self._embedding_log_records = 0
+    
+    def _load_embedding_index_locked(self) -> None:
+        """
+        Load the embedding snapshot and replay the append log on first use; caller holds _write_lock.
+        
+        Holding the lock keeps the torn-tail truncation below from racing an
+        append in _save_embedding_locked.
+        """
+        if self._embedding_loaded:
+            return
+        
+        try:
+            self._read_embedding_index_locked()
+        finally:
+            # Published last, so unlocked readers never see a half-loaded index
+            self._embedding_loaded = True
+    
+    def _read_embedding_index_locked(self) -> None:
+        """Rebuild the in-memory embedding index from disk; caller holds _write_lock."""
+        import numpy as np
+        
+        self._embedding_hashes = []
+        self._embedding_rows = {}
+        self._embedding_buffer = None
+        self._embedding_snapshot_rows = 0
+        self._embedding_log_records = 0
+        
+        if self.embedding_file.exists():
+            try:
+                with np.load(self.embedding_file) as data:
+                    hashes = [str(h) for h in data["hashes"]]
+                    matrix = data["embeddings"].astype(np.float32)
+                self._embedding_buffer = matrix
+                self._embedding_rows = {description_hash: row for row, description_hash in enumerate(hashes)}
+                self._embedding_hashes = hashes
+                self._embedding_snapshot_rows = len(hashes)
+            except (OSError, KeyError, ValueError):
+                # A damaged snapshot only costs semantic hits; exact lookups still work
+                self._embedding_hashes = []
+                self._embedding_rows = {}
+                self._embedding_buffer = None
+        
+        try:
+            log_data = self.embedding_log.read_bytes()
+        except OSError:
+            return
+        
+        records, complete_length = _decode_embedding_records(log_data)
+        if complete_length < len(log_data):
+            # Drop a torn tail so later appends start on a record boundary
+            try:
+                os.truncate(self.embedding_log, complete_length)
+            except OSError:
+                pass
+        
+        for description_hash, vector in records:
+            self._apply_embedding(description_hash, vector)
+        self._embedding_log_records = len(records)
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics and metadata.
         
+        Totals come from the in-memory index, refreshed from the lines
+        appended since the last call.
+        
         Returns:
             dict: Cache statistics including total schemas, file size, etc.
         """
         try:
-            cache_data = read_json_file(self.cache_file)
+            self.flush()
+            with self._write_lock:
+                self._refresh_index_locked()
+                total_schemas = len(self._index)
+                last_updated = self._index_last_updated
             
             return {
-                "total_schemas": cache_data.get("metadata", {}).get("total_schemas", 0),
-                "last_updated": cache_data.get("metadata", {}).get("last_updated"),
-                "cache_file_size": get_file_size(self.cache_file),
+                "total_schemas": total_schemas,
+                "last_updated": last_updated,
+                "cache_file_size": get_file_size(self.index_file),
                 "backup_file_size": get_file_size(self.backup_file),
-                "cache_file_path": str(self.cache_file),
+                "cache_file_path": str(self.cache_dir),
                 "backup_file_path": str(self.backup_file)
             }
-        except (FileNotFoundError, json.JSONDecodeError, OSError):
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, OSError, CacheError):
             return {
                 "total_schemas": 0,
                 "last_updated": None,
                 "cache_file_size": 0,
                 "backup_file_size": 0,
-                "cache_file_path": str(self.cache_file),
+                "cache_file_path": str(self.cache_dir),
                 "backup_file_path": str(self.backup_file),
                 "error": "Cache file not accessible"
             }
@@ -180,106 +724,51 @@ class SchemaCache:
         Get list of all cached schema hashes.
         
         Returns:
-            list: List of description hashes in the cache
+            list: List of description hashes in the cache, oldest insert first
         """
         try:
-            cache_data = read_json_file(self.cache_file)
-            return list(cache_data.get("schemas", {}).keys())
-        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            self.flush()
+            with self._write_lock:
+                self._refresh_index_locked()
+                return list(self._index)
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, OSError, CacheError):
             return []
     
-    def _recover_from_backup(self, description_hash: str) -> Optional[GeneratedSchema]:
+    def is_cache_healthy(self) -> bool:
         """
-        Attempt to recover a schema from backup cache file.
+        Check if cache is accessible and has valid structure.
         
-        Args:
-            description_hash: Hash of the schema to recover
-            
-        Returns:
-            GeneratedSchema object if found in backup, None otherwise
-        """
-        try:
-            if not self.backup_file.exists():
-                return None
-            
-            backup_data = read_json_file(self.backup_file)
-            schemas = backup_data.get("schemas", {})
-            
-            if description_hash not in schemas:
-                return None
-            
-            schema_data = schemas[description_hash]
-            
-            return GeneratedSchema(
-                description_hash=schema_data["description_hash"],
-                fields_schema=schema_data["fields_schema"],
-                created_at=datetime.fromisoformat(schema_data["created_at"]),
-                domain=schema_data["domain"]
-            )
-            
-        except (FileNotFoundError, json.JSONDecodeError, OSError):
-            return None
-    
-    def _recreate_cache_with_schema(self, description_hash: str, schema: GeneratedSchema) -> bool:
-        """
-        Recreate cache file with a single schema (recovery method).
+        Independent of cache size: only index lines appended since the last
+        check are parsed, and schema files are not visited (a missing one is
+        just a cache miss).
         
-        Args:
-            description_hash: Hash of the schema
-            schema: GeneratedSchema object
-            
         Returns:
-            bool: True if cache was recreated successfully
+            bool: True if queued writes flush, the index parses and the cache
+                directory is writable
         """
         try:
-            new_cache = {
-                "version": "1.0",
-                "created_at": datetime.now().isoformat(),
-                "schemas": {
-                    description_hash: {
-                        "description_hash": schema.description_hash,
-                        "fields_schema": schema.fields_schema,
-                        "created_at": schema.created_at.isoformat(),
-                        "domain": schema.domain
-                    }
-                },
-                "metadata": {
-                    "total_schemas": 1,
-                    "last_updated": datetime.now().isoformat()
-                }
-            }
-            
-            write_json_file(self.cache_file, new_cache, create_backup=False)
-            return True
+            self.flush()
+            with self._write_lock:
+                self._refresh_index_locked()
+            return os.access(self.cache_dir, os.W_OK | os.X_OK)
             
-        except OSError:
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, OSError, CacheError):
             return False
+
+
+@functools.lru_cache(maxsize=1)
+def get_schema_cache() -> SchemaCache:
+    """
+    Get the process-wide SchemaCache.
     
-    def is_cache_healthy(self) -> bool:
-        """
-        Check if cache is accessible and has valid structure.
+    Sharing one instance keeps a single in-memory LRU, write queue and index
+    view per process instead of rebuilding them for every user.
+    
+    Returns:
+        SchemaCache instance (created on first call)
         
-        Returns:
-            bool: True if cache is healthy
-        """
-        try:
-            cache_data = read_json_file(self.cache_file)
-            
-            # Check required keys
-            required_keys = ["version", "schemas", "metadata"]
-            if not all(key in cache_data for key in required_keys):
-                return False
-            
-            # Check metadata structure
-            metadata = cache_data.get("metadata", {})
-            if "total_schemas" not in metadata or "last_updated" not in metadata:
-                return False
-            
-            # Validate schema count
-            actual_count = len(cache_data.get("schemas", {}))
-            reported_count = metadata.get("total_schemas", 0)
-            
-            return actual_count == reported_count
-            
-        except (FileNotFoundError, json.JSONDecodeError, OSError):
-            return False
\ No newline at end of file
+    Raises:
+        CacheError: If the cache directory cannot be initialized (not cached,
+            so the next call retries)
+    """
+    return SchemaCache()
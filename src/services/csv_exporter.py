@@ -1,26 +1,42 @@
 """CSV export service for converting synthetic datasets to CSV format."""
 
+import csv
+import functools
 import re
+import string
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Union
 from io import StringIO
 
-import pandas as pd
-
 from src.api.models import SyntheticDataset, DatasetResponse
 from src.core.exceptions import ValidationError
 
+# Filename sanitization patterns, compiled once
+_STOPWORD_RE = re.compile(r'\b(generate|create|dataset|data|for|the|a|an|with|and|or)\b')
+_NONWORD_RE = re.compile(r'[^\w\-_.]')
+_DUP_UNDERSCORE_RE = re.compile(r'_{2,}')
+
+# ASCII characters outside [\w\-.] mapped to '_' in one C-level pass
+_SAFE_ASCII = set(string.ascii_letters + string.digits + '-_.')
+_UNSAFE_ASCII_TABLE = str.maketrans({c: '_' for c in map(chr, range(128)) if c not in _SAFE_ASCII})
+
+
+def _utf8_length(text: str) -> int:
+    """UTF-8 byte length of text, without encoding it when it is pure ASCII."""
+    # str.isascii() is O(1) in CPython (a flag on the string object)
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
 
 class CSVExporter:
     """Service for exporting synthetic datasets to CSV format."""
     
     def __init__(self) -> None:
         """Initialize CSVExporter with default configurations."""
+        # csv.writer options shared by export_to_csv and iter_csv
         self.csv_options = {
-            'index': False,  # Don't include row indices
-            'encoding': 'utf-8',  # Unicode support
-            'quoting': 1,  # Quote all fields (csv.QUOTE_ALL equivalent)
+            'quoting': csv.QUOTE_ALL,  # Quote all fields (part of the output format)
             'lineterminator': '\n'  # Cross-platform line endings
         }
     
@@ -28,6 +44,9 @@ class CSVExporter:
         """
         Convert SyntheticDataset to CSV format.
         
+        Rows are written straight from the records with the C csv writer; no
+        DataFrame is built.
+        
         Args:
             dataset: Generated synthetic dataset to export
             description: Original description for filename generation
@@ -39,11 +58,11 @@ class CSVExporter:
             ValidationError: If dataset conversion fails
         """
         try:
-            # Convert dataset to pandas DataFrame
-            df = self._create_dataframe(dataset)
+            # Validate dataset structure
+            self._validate_dataset(dataset)
             
             # Generate CSV content
-            csv_content = self._dataframe_to_csv(df)
+            csv_content = self._dataset_to_csv(dataset)
             
             # Generate filename
             filename = self.generate_filename(description, dataset.domain)
@@ -52,95 +71,165 @@ class CSVExporter:
                 csv_content=csv_content,
                 filename=filename,
                 row_count=dataset.row_count,
-                content_type="text/csv"
+                content_type="text/csv",
+                byte_length=_utf8_length(csv_content)
             )
             
         except Exception as e:
             raise ValidationError(f"Failed to export dataset to CSV: {str(e)}")
     
-    def _create_dataframe(self, dataset: SyntheticDataset) -> pd.DataFrame:
+    def _dataset_to_csv(self, dataset: SyntheticDataset) -> str:
         """
-        Create pandas DataFrame from SyntheticDataset.
+        Write a validated dataset as CSV text.
         
         Args:
             dataset: Synthetic dataset to convert
             
         Returns:
-            Pandas DataFrame with proper column ordering
+            CSV content as string (header row first, columns in field_names order)
+        """
+        buffer = StringIO()
+        writer = csv.writer(buffer, **self.csv_options)
+        field_names = dataset.field_names
+        
+        writer.writerow(field_names)
+        writer.writerows(dataset.row_values())
+        
+        return buffer.getvalue()
+    
+    def iter_csv(self, dataset: SyntheticDataset, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Stream SyntheticDataset as UTF-8 encoded CSV chunks.
+        
+        Produces the same layout as export_to_csv (header row, all fields quoted,
+        ``\\n`` line endings) without materializing the whole file. The dataset is
+        validated before the iterator is returned, so structural errors surface
+        before any bytes are sent.
+        
+        Args:
+            dataset: Generated synthetic dataset to export
+            chunk_size: Approximate number of characters buffered per chunk
+            
+        Returns:
+            Iterator over encoded CSV chunks
             
         Raises:
-            ValidationError: If DataFrame creation fails
+            ValidationError: If the dataset structure is invalid
         """
-        try:
-            # Validate dataset structure
-            if not dataset.data:
-                raise ValidationError("Dataset contains no data records")
-            
-            if not dataset.field_names:
-                raise ValidationError("Dataset contains no field names")
-            
-            # Create DataFrame from data records
-            df = pd.DataFrame(dataset.data)
-            
-            # Ensure column ordering matches field_names
-            if set(df.columns) != set(dataset.field_names):
-                missing_cols = set(dataset.field_names) - set(df.columns)
-                extra_cols = set(df.columns) - set(dataset.field_names)
-                
-                error_msg = []
-                if missing_cols:
-                    error_msg.append(f"Missing columns: {missing_cols}")
-                if extra_cols:
-                    error_msg.append(f"Extra columns: {extra_cols}")
-                
-                raise ValidationError(f"Column mismatch: {'; '.join(error_msg)}")
-            
-            # Reorder columns to match field_names order
-            df = df[dataset.field_names]
-            
-            # Validate row count
-            if len(df) != dataset.row_count:
-                raise ValidationError(f"Row count mismatch: DataFrame has {len(df)} rows, expected {dataset.row_count}")
-            
-            return df
-            
-        except pd.errors.EmptyDataError:
-            raise ValidationError("Cannot create DataFrame from empty dataset")
-        except pd.errors.ParserError as e:
-            raise ValidationError(f"DataFrame parsing error: {str(e)}")
-        except Exception as e:
-            raise ValidationError(f"DataFrame creation failed: {str(e)}")
+        self._validate_dataset(dataset)
+        return self._iter_csv_chunks(dataset, chunk_size)
     
-    def _dataframe_to_csv(self, df: pd.DataFrame) -> str:
+    def write_csv_file(self, dataset: SyntheticDataset, file_path: Union[str, Path]) -> int:
         """
-        Convert pandas DataFrame to CSV string.
+        Write SyntheticDataset as a UTF-8 CSV file.
+        
+        The encoded chunks from iter_csv go straight to disk, so memory use
+        stays bounded by the chunk size instead of the dataset size.
         
         Args:
-            df: DataFrame to convert
+            dataset: Generated synthetic dataset to export
+            file_path: Destination path (overwritten if it exists)
             
         Returns:
-            CSV content as string
+            int: Number of bytes written
             
         Raises:
-            ValidationError: If CSV conversion fails
+            ValidationError: If the dataset structure is invalid
+            OSError: If the file cannot be written
         """
-        try:
-            # Use StringIO to capture CSV output
-            csv_buffer = StringIO()
-            df.to_csv(csv_buffer, **self.csv_options)
+        chunks = self.iter_csv(dataset)
+        
+        byte_count = 0
+        with open(file_path, 'wb') as f:
+            for chunk in chunks:
+                byte_count += f.write(chunk)
+        
+        return byte_count
+    
+    def _iter_csv_chunks(self, dataset: SyntheticDataset, chunk_size: int) -> Iterator[bytes]:
+        """Write rows into a rolling buffer and yield it whenever it fills up."""
+        buffer = StringIO()
+        writer = csv.writer(buffer, **self.csv_options)
+        field_names = dataset.field_names
+        
+        writer.writerow(field_names)
+        for values in dataset.row_values():
+            writer.writerow(values)
+            if buffer.tell() >= chunk_size:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+        
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+    
+    def _validate_dataset(self, dataset: SyntheticDataset) -> None:
+        """
+        Check dataset structure before export.
+        
+        Args:
+            dataset: Synthetic dataset to validate
+            
+        Raises:
+            ValidationError: If the dataset is empty or its columns/row count mismatch
+        """
+        if dataset.records is None and dataset.columns is not None:
+            self._validate_columns(dataset)
+            return
+        
+        if not dataset.records:
+            raise ValidationError("Dataset contains no data records")
+        
+        if not dataset.field_names:
+            raise ValidationError("Dataset contains no field names")
+        
+        columns = set().union(*dataset.records)
+        if columns != set(dataset.field_names):
+            missing_cols = set(dataset.field_names) - columns
+            extra_cols = columns - set(dataset.field_names)
             
-            # Get CSV content and clean up
-            csv_content = csv_buffer.getvalue()
-            csv_buffer.close()
+            error_msg = []
+            if missing_cols:
+                error_msg.append(f"Missing columns: {missing_cols}")
+            if extra_cols:
+                error_msg.append(f"Extra columns: {extra_cols}")
             
-            # Validate CSV content
-            if not csv_content.strip():
-                raise ValidationError("Generated CSV content is empty")
+            raise ValidationError(f"Column mismatch: {'; '.join(error_msg)}")
+        
+        if len(dataset.records) != dataset.row_count:
+            raise ValidationError(f"Row count mismatch: dataset has {len(dataset.records)} rows, expected {dataset.row_count}")
+    
+    def _validate_columns(self, dataset: SyntheticDataset) -> None:
+        """
+        Check a column-oriented dataset before export, without building rows.
+        
+        Args:
+            dataset: Synthetic dataset holding ``columns``
             
-            return csv_content
+        Raises:
+            ValidationError: If the dataset is empty or its columns/row count mismatch
+        """
+        if not dataset.field_names:
+            raise ValidationError("Dataset contains no field names")
+        
+        columns = set(dataset.columns)
+        if columns != set(dataset.field_names):
+            missing_cols = set(dataset.field_names) - columns
+            extra_cols = columns - set(dataset.field_names)
             
-        except Exception as e:
-            raise ValidationError(f"CSV conversion failed: {str(e)}")
+            error_msg = []
+            if missing_cols:
+                error_msg.append(f"Missing columns: {missing_cols}")
+            if extra_cols:
+                error_msg.append(f"Extra columns: {extra_cols}")
+            
+            raise ValidationError(f"Column mismatch: {'; '.join(error_msg)}")
+        
+        lengths = {len(values) for values in dataset.columns.values()}
+        if lengths == {0}:
+            raise ValidationError("Dataset contains no data records")
+        if lengths != {dataset.row_count}:
+            raise ValidationError(f"Row count mismatch: column lengths {sorted(lengths)}, expected {dataset.row_count}")
     
     def generate_filename(self, description: str, domain: str = "") -> str:
         """
@@ -178,10 +267,14 @@ class CSVExporter:
         
         return filename
     
-    def _sanitize_filename(self, text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _sanitize_filename(text: str) -> str:
         """
         Sanitize text for use as filename.
         
+        Pure function of its input, memoized for repeated descriptions.
+        
         Args:
             text: Input text to sanitize
             
@@ -192,13 +285,16 @@ class CSVExporter:
         filename = text.lower()
         
         # Replace common words and phrases
-        filename = re.sub(r'\b(generate|create|dataset|data|for|the|a|an|with|and|or)\b', '', filename)
+        filename = _STOPWORD_RE.sub('', filename)
         
         # Replace whitespace and special characters with underscores
-        filename = re.sub(r'[^\w\-_.]', '_', filename)
+        filename = filename.translate(_UNSAFE_ASCII_TABLE)
+        if not filename.isascii():
+            # Keep Unicode word characters, replace other non-ASCII symbols
+            filename = _NONWORD_RE.sub('_', filename)
         
         # Replace multiple underscores with single underscore
-        filename = re.sub(r'_{2,}', '_', filename)
+        filename = _DUP_UNDERSCORE_RE.sub('_', filename)
         
         # Remove leading/trailing underscores
         filename = filename.strip('_')
@@ -219,11 +315,36 @@ class CSVExporter:
         Returns:
             Dictionary of HTTP headers for CSV download
         """
+        byte_length = dataset_response.byte_length
+        if byte_length is None:
+            byte_length = _utf8_length(dataset_response.csv_content)
+        
         return {
             "Content-Type": "text/csv; charset=utf-8",
             "Content-Disposition": f'attachment; filename="{dataset_response.filename}"',
             "X-Row-Count": str(dataset_response.row_count),
-            "X-Content-Length": str(len(dataset_response.csv_content.encode('utf-8')))
+            "X-Content-Length": str(byte_length)
+        }
+    
+    def get_stream_headers(self, filename: str, row_count: int) -> Dict[str, str]:
+        """
+        Generate HTTP headers for a streamed CSV response.
+        
+        Same as get_csv_headers minus X-Content-Length, which is not known
+        until the stream has been written; the /generate route adds it when
+        the whole CSV fits in one chunk.
+        
+        Args:
+            filename: Download filename
+            row_count: Number of rows in dataset
+            
+        Returns:
+            Dictionary of HTTP headers for CSV download
+        """
+        return {
+            "Content-Type": "text/csv; charset=utf-8",
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Row-Count": str(row_count)
         }
     
     def validate_csv_compatibility(self, csv_content: str) -> bool:
@@ -238,6 +359,7 @@ class CSVExporter:
         """
         try:
             # Test with pandas read_csv
+            import pandas as pd
             test_df = pd.read_csv(StringIO(csv_content))
             
             # Basic validation
@@ -1,40 +1,343 @@
 """Data generation service using Faker for realistic synthetic datasets."""
 
+import functools
+import re
 import time
 import random
+import secrets
+import threading
+import uuid
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Any, Optional, Callable
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Callable, Sequence, Tuple
 from decimal import Decimal
 
+import numpy as np
 from faker import Faker
 from faker.providers import BaseProvider
 
 from src.api.models import GeneratedSchema, SyntheticDataset
 from src.core.exceptions import ValidationError
 
+class _ThreadLocalFaker(threading.local):
+    """
+    Per-thread Faker instance plus the method maps bound to it.
+    
+    threading.local re-runs __init__ with the original arguments the first
+    time each thread touches the object, so a shared DataGenerator never
+    shares Faker state (or seeds) between threads.
+    """
+    
+    def __init__(self, locale: str) -> None:
+        self.faker = Faker(locale)
+        # Seed once from 64 bits of OS entropy for variety between threads.
+        # Reseeding mid-generation adds no randomness (Mersenne Twister's
+        # period is 2**19937 - 1), so don't reintroduce periodic reseeds.
+        self.faker.seed_instance(secrets.randbits(64))
+        self.faker_methods: Optional[Dict[str, Callable]] = None
+        self.fallback_generators: Optional[Dict[str, Callable]] = None
+
+
+# Domain-specific value sets for fallback scenarios. Shared by every instance
+# and read-only (tuples behind mapping proxies), since domain lookups are
+# memoized against it.
+DOMAIN_VALUES: Mapping[str, Mapping[str, Tuple[Any, ...]]] = MappingProxyType({
+    'ecommerce': MappingProxyType({
+        'category': ('Electronics', 'Clothing', 'Books', 'Home & Garden', 'Sports', 'Toys'),
+        'brand': ('Apple', 'Samsung', 'Nike', 'Adidas', 'Sony', 'Microsoft', 'Amazon'),
+        'rating': (1, 2, 3, 4, 5),
+        'status': ('Active', 'Inactive', 'Discontinued', 'Coming Soon'),
+        'product_type': ('Physical', 'Digital', 'Service', 'Subscription'),
+        'shipping_method': ('Standard', 'Express', 'Overnight', 'Free Shipping')
+    }),
+    'healthcare': MappingProxyType({
+        'blood_type': ('A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'),
+        'condition': ('Diabetes', 'Hypertension', 'Asthma', 'Arthritis', 'Heart Disease'),
+        'treatment': ('Medication', 'Physical Therapy', 'Surgery', 'Monitoring', 'Lifestyle Change'),
+        'insurance': ('Medicare', 'Medicaid', 'Private', 'Uninsured', 'VA Benefits'),
+        'department': ('Cardiology', 'Neurology', 'Orthopedics', 'Pediatrics', 'Emergency'),
+        'priority': ('Low', 'Medium', 'High', 'Critical')
+    }),
+    'finance': MappingProxyType({
+        'account_type': ('Checking', 'Savings', 'Credit', 'Investment', 'Loan'),
+        'transaction_type': ('Deposit', 'Withdrawal', 'Transfer', 'Payment', 'Fee'),
+        'status': ('Pending', 'Completed', 'Failed', 'Cancelled', 'Processing'),
+        'merchant_category': ('Gas Station', 'Grocery Store', 'Restaurant', 'Online Purchase', 'ATM'),
+        'currency': ('USD', 'EUR', 'GBP', 'CAD', 'JPY'),
+        'risk_level': ('Low', 'Medium', 'High', 'Very High')
+    }),
+    'education': MappingProxyType({
+        'grade_level': ('Freshman', 'Sophomore', 'Junior', 'Senior', 'Graduate'),
+        'subject': ('Mathematics', 'Science', 'English', 'History', 'Art', 'Physical Education'),
+        'degree': ('Bachelor', 'Master', 'PhD', 'Associate', 'Certificate'),
+        'major': ('Computer Science', 'Business', 'Engineering', 'Psychology', 'Biology'),
+        'semester': ('Fall', 'Spring', 'Summer', 'Winter'),
+        'grade': ('A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'D', 'F')
+    }),
+    'general': MappingProxyType({
+        'gender': ('Male', 'Female', 'Non-binary', 'Prefer not to say'),
+        'marital_status': ('Single', 'Married', 'Divorced', 'Widowed', 'Separated'),
+        'priority': ('Low', 'Medium', 'High', 'Critical'),
+        'status': ('Active', 'Inactive', 'Pending', 'Suspended'),
+        'language': ('English', 'Spanish', 'French', 'German', 'Chinese', 'Japanese'),
+        'timezone': ('PST', 'EST', 'CST', 'MST', 'UTC')
+    })
+})
+
+# Category name -> values; the first domain defining a category wins
+_CATEGORY_VALUES: Dict[str, Tuple[Any, ...]] = {
+    category: values
+    for categories in reversed(DOMAIN_VALUES.values())
+    for category, values in categories.items()
+}
+
+# Per domain: (category, category keywords, values), in table order
+_DOMAIN_CATEGORY_KEYWORDS: Dict[str, Tuple[Tuple[str, Tuple[str, ...], Tuple[Any, ...]], ...]] = {
+    domain: tuple((category, tuple(category.split('_')), values) for category, values in categories.items())
+    for domain, categories in DOMAIN_VALUES.items()
+}
+
+
+def _index_category_keywords() -> Dict[str, Tuple[Any, ...]]:
+    """
+    Map every category keyword to its values across all domains.
+    
+    Insertion order follows the table and the first category to use a keyword
+    keeps it, so the first keyword found in a field name identifies the first
+    matching category.
+    """
+    index: Dict[str, Tuple[Any, ...]] = {}
+    for category_keywords in _DOMAIN_CATEGORY_KEYWORDS.values():
+        for _, keywords, values in category_keywords:
+            for keyword in keywords:
+                index.setdefault(keyword, values)
+    return index
+
+
+_KEYWORD_VALUES = _index_category_keywords()
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_domain_values(field_lower: str, hint_lower: str) -> Optional[Tuple[Any, ...]]:
+    """
+    Resolve the domain value set for a field, memoized across instances.
+    
+    A category matches when one of its '_'-separated keywords occurs in the
+    field name (which covers the category name itself).
+    
+    Args:
+        field_lower: Lowercased field name
+        hint_lower: Lowercased domain or method hint
+        
+    Returns:
+        Matching value tuple, or None
+    """
+    # Domain hint directly names a category
+    values = _CATEGORY_VALUES.get(hint_lower)
+    if values is not None:
+        return values
+    
+    # Domain hint names a domain; look for a category matching the field name
+    # (or a category containing the whole field name)
+    for category, keywords, values in _DOMAIN_CATEGORY_KEYWORDS.get(hint_lower, ()):
+        if any(keyword in field_lower for keyword in keywords) or field_lower in category:
+            return values
+    
+    # General field name pattern matching across all domains
+    return next((values for keyword, values in _KEYWORD_VALUES.items() if keyword in field_lower), None)
+
+
+# Field-name keyword groups for the fallback generator, in priority order
+_FALLBACK_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    # Name patterns
+    ('name', ('name', 'full_name', 'customer_name')),
+    ('first_name', ('first', 'fname', 'given')),
+    ('last_name', ('last', 'lname', 'surname', 'family')),
+    # Contact patterns
+    ('email', ('email', 'mail')),
+    ('phone', ('phone', 'tel', 'mobile')),
+    # Date patterns
+    ('date', ('date', 'birth', 'created', 'updated')),
+    # Address patterns
+    ('address', ('address', 'street')),
+    ('city', ('city',)),
+    ('state', ('state', 'province')),
+    ('country', ('country', 'nation')),
+    ('postcode', ('zip', 'postal')),
+    # Numeric patterns
+    ('identifier', ('id', 'number', 'num', 'count')),
+    ('price', ('price', 'cost', 'amount', 'salary')),
+    ('age', ('age', 'year')),
+    # Text patterns
+    ('description', ('description', 'comment', 'note')),
+    ('title', ('title', 'subject')),
+    # Company patterns
+    ('company', ('company', 'employer', 'organization')),
+    ('job', ('job', 'position', 'role')),
+    # Boolean patterns
+    ('boolean', ('active', 'enabled', 'valid', 'is_')),
+)
+
+# One lookahead alternative per group, tried in order from the start of the
+# name, so a single match() keeps first-group-wins priority rather than
+# returning whichever keyword occurs leftmost
+_FALLBACK_PATTERN = re.compile('|'.join(
+    f"(?=.*?(?:{'|'.join(map(re.escape, keywords))}))(?P<{group}>)"
+    for group, keywords in _FALLBACK_KEYWORDS
+), re.DOTALL)
+
+
+# Conversions applied to uniformly typed columns for JSON serialization
+_COLUMN_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    date: date.isoformat,
+    datetime: datetime.isoformat,
+    Decimal: float,
+}
+
+
+class _ChoiceColumn:
+    """Uniform choice over a fixed list of values, vectorizable with NumPy."""
+    
+    __slots__ = ("values",)
+    
+    def __init__(self, values: Sequence[Any]) -> None:
+        self.values = values
+    
+    def __call__(self) -> Any:
+        return random.choice(self.values)
+    
+    def batch(self, rng: np.random.Generator, size: int) -> List[Any]:
+        # Draw indices rather than rng.choice(values) so values keep their Python types
+        values = self.values
+        return [values[index] for index in rng.integers(len(values), size=size).tolist()]
+
+
+class _RandomIntColumn:
+    """Uniform integer in [low, high], vectorizable with NumPy."""
+    
+    __slots__ = ("low", "high")
+    
+    def __init__(self, low: int, high: int) -> None:
+        self.low = low
+        self.high = high
+    
+    def __call__(self) -> int:
+        return random.randint(self.low, self.high)
+    
+    def batch(self, rng: np.random.Generator, size: int) -> List[int]:
+        return rng.integers(self.low, self.high + 1, size=size).tolist()
+
+
+class _BooleanColumn:
+    """True with the given probability, vectorizable with NumPy."""
+    
+    __slots__ = ("probability",)
+    
+    def __init__(self, probability: float = 0.5) -> None:
+        self.probability = probability
+    
+    def __call__(self) -> bool:
+        return random.random() < self.probability
+    
+    def batch(self, rng: np.random.Generator, size: int) -> List[bool]:
+        return (rng.random(size) < self.probability).tolist()
+
+
+class _UUID4Column:
+    """Random UUID4 strings (as faker.uuid4), vectorizable with NumPy."""
+    
+    __slots__ = ()
+    
+    def __call__(self) -> str:
+        return str(uuid.uuid4())
+    
+    def batch(self, rng: np.random.Generator, size: int) -> List[str]:
+        raw = rng.bytes(16 * size)
+        return [str(uuid.UUID(bytes=raw[offset:offset + 16], version=4)) for offset in range(0, 16 * size, 16)]
+
+
+class _HexColorColumn:
+    """Hex triplet colors (as faker.hex_color), vectorizable with NumPy."""
+    
+    __slots__ = ()
+    
+    def __call__(self) -> str:
+        return f"#{random.randint(1, 16777215):06x}"
+    
+    def batch(self, rng: np.random.Generator, size: int) -> List[str]:
+        return [f"#{value:06x}" for value in rng.integers(1, 16777216, size=size).tolist()]
+
 
 class DataGenerator:
     """Service for generating synthetic datasets using Faker library."""
     
     def __init__(self, locale: str = 'en_US') -> None:
         """
-        Initialize DataGenerator with Faker instance and method mappings.
+        Initialize DataGenerator for a locale.
+        
+        Each thread using the instance gets its own seeded Faker; it and the
+        method mappings are built lazily on first use in that thread. Prefer
+        DataGenerator.get() to reuse one instance per locale.
         
         Args:
             locale: Faker locale for data generation (default: en_US)
         """
-        self.faker = Faker(locale)
-        self.faker.seed_instance(random.randint(1, 100000))  # Ensure variety
-        
-        # Initialize method mapping for schema to Faker conversion
-        self._init_faker_method_mapping()
+        self.locale = locale
+        self._local = _ThreadLocalFaker(locale)
+        # Shared by all vectorized (choice/randint/boolean) columns; NumPy
+        # Generators serialize concurrent draws with their own lock
+        self.rng = np.random.default_rng()
+    
+    @classmethod
+    def get(cls, locale: str = 'en_US') -> "DataGenerator":
+        """
+        Return the process-wide DataGenerator for a locale.
         
-        # Domain-specific value sets for fallback scenarios
-        self._init_custom_domain_values()
+        Args:
+            locale: Faker locale for data generation (default: en_US)
+            
+        Returns:
+            Shared DataGenerator instance
+        """
+        # Passed positionally so get(), get('en_US') and get(locale='en_US')
+        # share one cache entry
+        return cls._get_for_locale(locale)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _get_for_locale(cls, locale: str) -> "DataGenerator":
+        """Create and cache the DataGenerator for a locale."""
+        return cls(locale)
+    
+    @property
+    def faker(self) -> Faker:
+        """Faker instance for the current thread."""
+        return self._local.faker
+    
+    @property
+    def faker_methods(self) -> Dict[str, Callable]:
+        """Mapping from schema field types to the current thread's Faker methods."""
+        local = self._local
+        if local.faker_methods is None:
+            local.faker_methods = self._build_faker_methods()
+        return local.faker_methods
+    
+    @property
+    def fallback_generators(self) -> Dict[str, Callable]:
+        """Generators for the field-name keyword groups in _FALLBACK_KEYWORDS."""
+        local = self._local
+        if local.fallback_generators is None:
+            local.fallback_generators = self._build_fallback_generators()
+        return local.fallback_generators
+    
+    def warm_up(self) -> None:
+        """Build the calling thread's Faker and method maps ahead of its first request."""
+        self.faker_methods
+        self.fallback_generators
     
-    def _init_faker_method_mapping(self) -> None:
-        """Initialize mapping from schema field types to Faker methods."""
-        self.faker_methods: Dict[str, Callable] = {
+    def _build_faker_methods(self) -> Dict[str, Callable]:
+        """Build the mapping from schema field types to Faker methods."""
+        return {
             # Names
             'name': self.faker.name,
             'first_name': self.faker.first_name,
@@ -51,19 +354,19 @@ class DataGenerator:
             
             # Dates
             'date': self.faker.date,
-            'past_date': lambda: self.faker.date_between(start_date='-2y', end_date='today'),
-            'future_date': lambda: self.faker.date_between(start_date='today', end_date='+2y'),
-            'date_between': lambda: self.faker.date_between(start_date='-1y', end_date='+1y'),
+            'past_date': functools.partial(self.faker.date_between, start_date='-2y', end_date='today'),
+            'future_date': functools.partial(self.faker.date_between, start_date='today', end_date='+2y'),
+            'date_between': functools.partial(self.faker.date_between, start_date='-1y', end_date='+1y'),
             'datetime': self.faker.date_time,
             'time': self.faker.time,
-            'birth_date': lambda: self.faker.date_between(start_date='-80y', end_date='-18y'),
+            'birth_date': functools.partial(self.faker.date_between, start_date='-80y', end_date='-18y'),
             
             # Numbers
-            'random_int': lambda: self.faker.random_int(min=1, max=1000),
-            'random_number': lambda: self.faker.random_int(min=1, max=10000),
+            'random_int': _RandomIntColumn(1, 1000),
+            'random_number': _RandomIntColumn(1, 10000),
             'float': lambda: round(self.faker.pyfloat(left_digits=3, right_digits=2, positive=True), 2),
             'pyfloat': lambda: round(self.faker.pyfloat(left_digits=3, right_digits=2, positive=True), 2),
-            'pydecimal': lambda: self.faker.pydecimal(left_digits=3, right_digits=2, positive=True),
+            'pydecimal': functools.partial(self.faker.pydecimal, left_digits=3, right_digits=2, positive=True),
             'currency': lambda: f"${self.faker.pydecimal(left_digits=3, right_digits=2, positive=True)}",
             'price': lambda: round(self.faker.pyfloat(min_left_digits=1, max_left_digits=4, right_digits=2, positive=True), 2),
             
@@ -78,9 +381,9 @@ class DataGenerator:
             'postcode': self.faker.postcode,
             
             # Text
-            'text': lambda: self.faker.text(max_nb_chars=200),
+            'text': functools.partial(self.faker.text, max_nb_chars=200),
             'sentence': self.faker.sentence,
-            'paragraph': lambda: self.faker.paragraph(nb_sentences=3),
+            'paragraph': functools.partial(self.faker.paragraph, nb_sentences=3),
             'word': self.faker.word,
             'words': lambda: ' '.join(self.faker.words(nb=random.randint(2, 5))),
             'catch_phrase': self.faker.catch_phrase,
@@ -90,7 +393,7 @@ class DataGenerator:
             'company': self.faker.company,
             'job': self.faker.job,
             'company_suffix': self.faker.company_suffix,
-            'department': lambda: random.choice(['Sales', 'Marketing', 'Engineering', 'HR', 'Finance', 'Operations']),
+            'department': _ChoiceColumn(['Sales', 'Marketing', 'Engineering', 'HR', 'Finance', 'Operations']),
             
             # Internet
             'url': self.faker.url,
@@ -99,67 +402,51 @@ class DataGenerator:
             'mac_address': self.faker.mac_address,
             
             # Identifiers
-            'uuid4': self.faker.uuid4,
+            'uuid4': _UUID4Column(),
             'ssn': self.faker.ssn,
             'ein': self.faker.ein,
             'credit_card_number': self.faker.credit_card_number,
             'iban': self.faker.iban,
             
             # Boolean
-            'boolean': self.faker.boolean,
-            'pybool': self.faker.pybool,
+            'boolean': _BooleanColumn(),
+            'pybool': _BooleanColumn(),
             
             # Colors
             'color_name': self.faker.color_name,
-            'hex_color': self.faker.hex_color,
+            'hex_color': _HexColorColumn(),
             'rgb_color': self.faker.rgb_color,
         }
     
-    def _init_custom_domain_values(self) -> None:
-        """Initialize domain-specific value sets for custom field generation."""
-        self.domain_values: Dict[str, Dict[str, List[Any]]] = {
-            'ecommerce': {
-                'category': ['Electronics', 'Clothing', 'Books', 'Home & Garden', 'Sports', 'Toys'],
-                'brand': ['Apple', 'Samsung', 'Nike', 'Adidas', 'Sony', 'Microsoft', 'Amazon'],
-                'rating': [1, 2, 3, 4, 5],
-                'status': ['Active', 'Inactive', 'Discontinued', 'Coming Soon'],
-                'product_type': ['Physical', 'Digital', 'Service', 'Subscription'],
-                'shipping_method': ['Standard', 'Express', 'Overnight', 'Free Shipping']
-            },
-            'healthcare': {
-                'blood_type': ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'],
-                'condition': ['Diabetes', 'Hypertension', 'Asthma', 'Arthritis', 'Heart Disease'],
-                'treatment': ['Medication', 'Physical Therapy', 'Surgery', 'Monitoring', 'Lifestyle Change'],
-                'insurance': ['Medicare', 'Medicaid', 'Private', 'Uninsured', 'VA Benefits'],
-                'department': ['Cardiology', 'Neurology', 'Orthopedics', 'Pediatrics', 'Emergency'],
-                'priority': ['Low', 'Medium', 'High', 'Critical']
-            },
-            'finance': {
-                'account_type': ['Checking', 'Savings', 'Credit', 'Investment', 'Loan'],
-                'transaction_type': ['Deposit', 'Withdrawal', 'Transfer', 'Payment', 'Fee'],
-                'status': ['Pending', 'Completed', 'Failed', 'Cancelled', 'Processing'],
-                'merchant_category': ['Gas Station', 'Grocery Store', 'Restaurant', 'Online Purchase', 'ATM'],
-                'currency': ['USD', 'EUR', 'GBP', 'CAD', 'JPY'],
-                'risk_level': ['Low', 'Medium', 'High', 'Very High']
-            },
-            'education': {
-                'grade_level': ['Freshman', 'Sophomore', 'Junior', 'Senior', 'Graduate'],
-                'subject': ['Mathematics', 'Science', 'English', 'History', 'Art', 'Physical Education'],
-                'degree': ['Bachelor', 'Master', 'PhD', 'Associate', 'Certificate'],
-                'major': ['Computer Science', 'Business', 'Engineering', 'Psychology', 'Biology'],
-                'semester': ['Fall', 'Spring', 'Summer', 'Winter'],
-                'grade': ['A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'D', 'F']
-            },
-            'general': {
-                'gender': ['Male', 'Female', 'Non-binary', 'Prefer not to say'],
-                'marital_status': ['Single', 'Married', 'Divorced', 'Widowed', 'Separated'],
-                'priority': ['Low', 'Medium', 'High', 'Critical'],
-                'status': ['Active', 'Inactive', 'Pending', 'Suspended'],
-                'language': ['English', 'Spanish', 'French', 'German', 'Chinese', 'Japanese'],
-                'timezone': ['PST', 'EST', 'CST', 'MST', 'UTC']
-            }
+    def _build_fallback_generators(self) -> Dict[str, Callable]:
+        """Build the generators for the field-name keyword groups in _FALLBACK_KEYWORDS."""
+        return {
+            'name': self.faker.name,
+            'first_name': self.faker.first_name,
+            'last_name': self.faker.last_name,
+            'email': self.faker.email,
+            'phone': self.faker.phone_number,
+            'date': functools.partial(self.faker.date_between, start_date='-2y', end_date='today'),
+            'address': self.faker.address,
+            'city': self.faker.city,
+            'state': self.faker.state,
+            'country': self.faker.country,
+            'postcode': self.faker.postcode,
+            'identifier': _RandomIntColumn(1, 100000),
+            'price': lambda: round(self.faker.pyfloat(min_left_digits=1, max_left_digits=4, right_digits=2, positive=True), 2),
+            'age': _RandomIntColumn(18, 80),
+            'description': functools.partial(self.faker.text, max_nb_chars=200),
+            'title': self.faker.sentence,
+            'company': self.faker.company,
+            'job': self.faker.job,
+            'boolean': _BooleanColumn(),
         }
     
+    @property
+    def domain_values(self) -> Mapping[str, Mapping[str, Tuple[Any, ...]]]:
+        """Shared, read-only domain value sets used for custom field generation."""
+        return DOMAIN_VALUES
+    
     def map_schema_to_faker(self, schema: Dict[str, Any]) -> Dict[str, Callable]:
         """
         Map schema fields to appropriate Faker methods or fallback functions.
@@ -203,17 +490,31 @@ class DataGenerator:
         if faker_method in self.faker_methods:
             base_method = self.faker_methods[faker_method]
             
+            if parameters and hasattr(base_method, 'batch'):
+                vectorized = self._parameterize_column(base_method, parameters)
+                if vectorized is not None:
+                    return vectorized
+                # Parameters the vectorized column can't express go to Faker itself
+                if hasattr(self.faker, faker_method):
+                    base_method = getattr(self.faker, faker_method)
+            
             # Apply parameters if provided
             if parameters:
-                return lambda: self._call_with_parameters(base_method, parameters)
+                return self._bind_parameters(base_method, parameters)
             else:
                 return base_method
         
+        # random_element over an explicit list is a plain vectorizable choice
+        if faker_method == 'random_element' and set(parameters) == {'elements'}:
+            elements = parameters['elements']
+            if isinstance(elements, (list, tuple)) and elements:
+                return _ChoiceColumn(list(elements))
+        
         # Try Faker method with parameters
         if hasattr(self.faker, faker_method):
             faker_func = getattr(self.faker, faker_method)
             if parameters:
-                return lambda: faker_func(**parameters)
+                return functools.partial(faker_func, **parameters)
             else:
                 return faker_func
         
@@ -225,22 +526,59 @@ class DataGenerator:
         # Fallback to generic generation based on field name pattern
         return self._get_fallback_generator(field_name)
     
-    def _call_with_parameters(self, method: Callable, parameters: Dict[str, Any]) -> Any:
+    @staticmethod
+    def _parameterize_column(column: Callable, parameters: Dict[str, Any]) -> Optional[Callable]:
         """
-        Call a method with parameters, handling potential errors gracefully.
+        Apply schema parameters to a vectorized column where they map directly.
         
         Args:
-            method: Method to call
+            column: Vectorized column generator from the method mapping
+            parameters: Parameters from the schema
+            
+        Returns:
+            Parameterized column, or None if the parameters need the Faker method
+        """
+        if isinstance(column, _RandomIntColumn) and set(parameters) <= {'min', 'max'}:
+            low = parameters.get('min', column.low)
+            high = parameters.get('max', column.high)
+            if isinstance(low, int) and isinstance(high, int) and low <= high:
+                return _RandomIntColumn(low, high)
+        
+        if isinstance(column, _BooleanColumn) and len(parameters) == 1:
+            # faker.boolean(chance_of_getting_true=...) / faker.pybool(truth_probability=...)
+            chance = parameters.get('chance_of_getting_true', parameters.get('truth_probability'))
+            if isinstance(chance, int) and 0 <= chance <= 100:
+                return _BooleanColumn(chance / 100)
+        
+        return None
+    
+    @staticmethod
+    def _bind_parameters(method: Callable, parameters: Dict[str, Any]) -> Callable:
+        """
+        Bind parameters to a method if it accepts them.
+        
+        The method is called once with the parameters up front, so one that
+        rejects them is bound without parameters instead of raising and
+        retrying on every value.
+        
+        Args:
+            method: Method to bind
             parameters: Parameters to pass
             
         Returns:
-            Generated value or fallback
+            functools.partial over the parameters, or the bare method if
+            parameter application fails
         """
         try:
-            return method(**parameters)
+            method(**parameters)
         except (TypeError, ValueError):
             # Fallback to method without parameters if parameter application fails
-            return method()
+            return method
+        except Exception:
+            # Any other failure is left to _generate_column's per-value
+            # fallback, which fills the column with placeholders
+            pass
+        return functools.partial(method, **parameters)
     
     def _get_domain_generator(self, field_name: str, domain_hint: str) -> Optional[Callable]:
         """
@@ -253,36 +591,8 @@ class DataGenerator:
         Returns:
             Generator function or None
         """
-        # First check if domain hint directly matches a category in any domain
-        for domain, categories in self.domain_values.items():
-            if domain_hint.lower() in categories:
-                values = categories[domain_hint.lower()]
-                return lambda vals=values: random.choice(vals)
-        
-        # Check if the domain hint matches a domain name and field has matching category
-        if domain_hint.lower() in self.domain_values:
-            domain_categories = self.domain_values[domain_hint.lower()]
-            field_lower = field_name.lower()
-            
-            # Look for field name patterns that match categories in this domain
-            for category, values in domain_categories.items():
-                category_keywords = category.split('_')
-                if (category in field_lower or 
-                    any(keyword in field_lower for keyword in category_keywords) or
-                    field_lower in category):
-                    return lambda vals=values: random.choice(vals)
-        
-        # General field name pattern matching across all domains
-        field_lower = field_name.lower()
-        for domain, categories in self.domain_values.items():
-            for category, values in categories.items():
-                category_keywords = category.split('_')
-                if (category in field_lower or 
-                    any(keyword in field_lower for keyword in category_keywords) or
-                    field_lower == category):
-                    return lambda vals=values: random.choice(vals)
-        
-        return None
+        values = _resolve_domain_values(field_name.lower(), domain_hint.lower())
+        return _ChoiceColumn(values) if values is not None else None
     
     def _get_fallback_generator(self, field_name: str) -> Callable:
         """
@@ -294,67 +604,12 @@ class DataGenerator:
         Returns:
             Appropriate generator function
         """
-        field_lower = field_name.lower()
-        
-        # Name patterns
-        if any(keyword in field_lower for keyword in ['name', 'full_name', 'customer_name']):
-            return self.faker.name
-        elif any(keyword in field_lower for keyword in ['first', 'fname', 'given']):
-            return self.faker.first_name
-        elif any(keyword in field_lower for keyword in ['last', 'lname', 'surname', 'family']):
-            return self.faker.last_name
-        
-        # Email patterns
-        elif any(keyword in field_lower for keyword in ['email', 'mail']):
-            return self.faker.email
-        
-        # Phone patterns
-        elif any(keyword in field_lower for keyword in ['phone', 'tel', 'mobile']):
-            return self.faker.phone_number
-        
-        # Date patterns
-        elif any(keyword in field_lower for keyword in ['date', 'birth', 'created', 'updated']):
-            return lambda: self.faker.date_between(start_date='-2y', end_date='today')
-        
-        # Address patterns
-        elif any(keyword in field_lower for keyword in ['address', 'street']):
-            return self.faker.address
-        elif 'city' in field_lower:
-            return self.faker.city
-        elif any(keyword in field_lower for keyword in ['state', 'province']):
-            return self.faker.state
-        elif any(keyword in field_lower for keyword in ['country', 'nation']):
-            return self.faker.country
-        elif any(keyword in field_lower for keyword in ['zip', 'postal']):
-            return self.faker.postcode
-        
-        # Numeric patterns
-        elif any(keyword in field_lower for keyword in ['id', 'number', 'num', 'count']):
-            return lambda: self.faker.random_int(min=1, max=100000)
-        elif any(keyword in field_lower for keyword in ['price', 'cost', 'amount', 'salary']):
-            return lambda: round(self.faker.pyfloat(min_left_digits=1, max_left_digits=4, right_digits=2, positive=True), 2)
-        elif any(keyword in field_lower for keyword in ['age', 'year']):
-            return lambda: self.faker.random_int(min=18, max=80)
-        
-        # Text patterns
-        elif any(keyword in field_lower for keyword in ['description', 'comment', 'note']):
-            return lambda: self.faker.text(max_nb_chars=200)
-        elif any(keyword in field_lower for keyword in ['title', 'subject']):
-            return self.faker.sentence
-        
-        # Company patterns
-        elif any(keyword in field_lower for keyword in ['company', 'employer', 'organization']):
-            return self.faker.company
-        elif any(keyword in field_lower for keyword in ['job', 'position', 'role']):
-            return self.faker.job
-        
-        # Boolean patterns
-        elif any(keyword in field_lower for keyword in ['active', 'enabled', 'valid', 'is_']):
-            return self.faker.boolean
+        match = _FALLBACK_PATTERN.match(field_name.lower())
+        if match:
+            return self.fallback_generators[match.lastgroup]
         
         # Default fallback
-        else:
-            return lambda: self.faker.word()
+        return self.faker.word
     
     def generate_data(self, schema: GeneratedSchema, row_count: int = 1000) -> SyntheticDataset:
         """
@@ -380,40 +635,102 @@ class DataGenerator:
         field_generators = self.map_schema_to_faker(schema.fields_schema)
         field_names = list(field_generators.keys())
         
-        # Generate data
-        data: List[Dict[str, Any]] = []
+        columns = self._generate_columns(field_generators, row_count)
+        
+        generation_time = time.time() - start_time
+        
+        # Stored column-wise; row dicts are only built if a caller reads .data
+        return SyntheticDataset(
+            columns=columns,
+            row_count=row_count,
+            field_names=field_names,
+            generation_time=round(generation_time, 3),
+            domain=schema.domain
+        )
+    
+    def _generate_columns(
+        self, field_generators: Dict[str, Callable], row_count: int
+    ) -> Dict[str, List[Any]]:
+        """
+        Generate rows column by column.
+        
+        The inner loop is a plain list append rather than a dict insert per
+        value, and no per-row dicts are allocated.
         
-        for row_idx in range(row_count):
-            # Add some randomization to prevent obvious patterns
-            if row_idx > 0 and row_idx % 100 == 0:
-                self.faker.seed_instance(random.randint(1, 100000))
+        Args:
+            field_generators: Field name to generator mapping from map_schema_to_faker
+            row_count: Number of rows to generate
             
-            row_data: Dict[str, Any] = {}
+        Returns:
+            Generated values keyed by field name
+        """
+        return {
+            field_name: self._generate_column(field_name, generator, row_count)
+            for field_name, generator in field_generators.items()
+        }
+    
+    def _generate_column(
+        self, field_name: str, generator: Callable, row_count: int
+    ) -> List[Any]:
+        """
+        Generate all values for one field.
+        
+        The column is first generated without a per-value guard; only if a
+        value raises is it regenerated value by value, with placeholders for
+        the values that fail.
+        
+        Args:
+            field_name: Name of the field
+            generator: Callable producing one value per call
+            row_count: Number of values to generate
             
-            for field_name, generator in field_generators.items():
+        Returns:
+            List of generated values, converted for JSON serialization
+        """
+        # Vectorized columns are drawn in one NumPy call (at MAX_ROWS the
+        # intermediate array is at most ~80KB) and never need conversion
+        batch = getattr(generator, 'batch', None)
+        if batch is not None:
+            return batch(self.rng, row_count)
+        
+        try:
+            column = [generator() for _ in range(row_count)]
+        except Exception:
+            column = []
+            append = column.append
+            for row_idx in range(row_count):
                 try:
-                    value = generator()
-                    
-                    # Convert certain types for JSON serialization
-                    if isinstance(value, (date, datetime)):
-                        row_data[field_name] = value.isoformat()
-                    elif isinstance(value, Decimal):
-                        row_data[field_name] = float(value)
-                    else:
-                        row_data[field_name] = value
-                        
+                    append(generator())
                 except Exception:
                     # Fallback to safe default if generation fails
-                    row_data[field_name] = f"sample_{field_name}_{row_idx}"
+                    append(f"sample_{field_name}_{row_idx}")
+        
+        return self._convert_column(column)
+    
+    @staticmethod
+    def _convert_column(column: List[Any]) -> List[Any]:
+        """
+        Convert date/datetime and Decimal values for JSON serialization.
+        
+        The column's value types are collected in one pass. A column of a
+        single type is converted with one map() of the converter for that type
+        (or passed through untouched); only mixed columns, e.g. with fallback
+        placeholders, pay for a per-value isinstance check.
+        
+        Args:
+            column: Raw generated values for one field
             
-            data.append(row_data)
+        Returns:
+            Column with dates as ISO strings and Decimals as floats
+        """
+        value_types = set(map(type, column))
         
-        generation_time = time.time() - start_time
+        if len(value_types) == 1:
+            converter = _COLUMN_CONVERTERS.get(value_types.pop())
+            return list(map(converter, column)) if converter else column
         
-        return SyntheticDataset(
-            data=data,
-            row_count=len(data),
-            field_names=field_names,
-            generation_time=round(generation_time, 3),
-            domain=schema.domain
-        )
\ No newline at end of file
+        if any(issubclass(value_type, date) for value_type in value_types):
+            column = [value.isoformat() if isinstance(value, date) else value for value in column]
+        if any(issubclass(value_type, Decimal) for value_type in value_types):
+            column = [float(value) if isinstance(value, Decimal) else value for value in column]
+        return column
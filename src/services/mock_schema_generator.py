@@ -3,11 +3,29 @@ Mock schema generator for demo/test mode.
 This allows testing the full stack without an OpenAI API key.
 """
 
+import re
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from src.api.models import GeneratedSchema
 from src.utils.hash_utils import generate_cache_key
 
+# Description keywords per template, in priority order
+_TEMPLATE_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("ecommerce", ("ecommerce", "product", "shop", "store", "catalog")),
+    ("healthcare", ("healthcare", "patient", "medical", "hospital", "health")),
+    ("finance", ("finance", "account", "bank", "transaction", "payment")),
+    ("employee", ("employee", "staff", "worker", "job", "salary")),
+    ("social", ("social", "user", "profile", "follower", "post")),
+    ("education", ("student", "education", "school", "grade", "university")),
+)
+
+# One lookahead alternative per template, tried in order, so a single match()
+# picks the highest-priority template rather than the leftmost keyword
+_TEMPLATE_PATTERN = re.compile("|".join(
+    f"(?=.*?(?:{'|'.join(map(re.escape, keywords))}))(?P<{template_key}>)"
+    for template_key, keywords in _TEMPLATE_KEYWORDS
+), re.DOTALL)
+
 
 class MockSchemaGenerator:
     """Generates mock schemas based on keywords in the description."""
@@ -105,22 +123,9 @@ class MockSchemaGenerator:
         Returns:
             GeneratedSchema with mock data
         """
-        description_lower = description.lower()
-
         # Determine domain based on keywords
-        template_key = "default"
-        if any(word in description_lower for word in ["ecommerce", "product", "shop", "store", "catalog"]):
-            template_key = "ecommerce"
-        elif any(word in description_lower for word in ["healthcare", "patient", "medical", "hospital", "health"]):
-            template_key = "healthcare"
-        elif any(word in description_lower for word in ["finance", "account", "bank", "transaction", "payment"]):
-            template_key = "finance"
-        elif any(word in description_lower for word in ["employee", "staff", "worker", "job", "salary"]):
-            template_key = "employee"
-        elif any(word in description_lower for word in ["social", "user", "profile", "follower", "post"]):
-            template_key = "social"
-        elif any(word in description_lower for word in ["student", "education", "school", "grade", "university"]):
-            template_key = "education"
+        match = _TEMPLATE_PATTERN.match(description.lower())
+        template_key = match.lastgroup if match else "default"
 
         template = self.templates[template_key]
 
@@ -3,7 +3,8 @@
 import json
 import hashlib
 import asyncio
-from datetime import datetime
+from collections import deque
+from datetime import date, datetime, timedelta
 from typing import Dict, Any, Optional
 import time
 from openai import AsyncOpenAI
@@ -18,7 +19,21 @@ from src.core.exceptions import (
 )
 from src.api.models import GeneratedSchema
 from src.utils.hash_utils import generate_cache_key
-from src.services.cache_service import SchemaCache
+from src.services.cache_service import get_schema_cache
+
+
+def _next_local_midnight() -> float:
+    """Epoch timestamp of the next local midnight, when the daily limit resets."""
+    return datetime.combine(date.today() + timedelta(days=1), datetime.min.time()).timestamp()
+
+
+# Faker methods known to work with the parameter checks in _validate_schema
+_VALID_FAKER_METHODS: frozenset = frozenset({
+    "name", "first_name", "last_name", "email", "phone_number", "address",
+    "city", "country", "date", "date_between", "text", "sentence", "paragraph",
+    "random_int", "random_element", "boolean", "pydecimal", "uuid4", "url",
+    "company", "job", "ssn", "credit_card_number", "iban"
+})
 
 
 class SchemaGenerator:
@@ -38,7 +53,7 @@ class SchemaGenerator:
         # Initialize cache service
         if settings.CACHE_ENABLED:
             try:
-                self.cache = SchemaCache()
+                self.cache = get_schema_cache()
             except Exception:
                 # Cache initialization failed, disable caching
                 self.cache = None
@@ -46,9 +61,10 @@ class SchemaGenerator:
             self.cache = None
         
         # Rate limiting tracking
-        self._request_times: list = []
+        # Monotonic timestamps of requests in the last minute; bounded by the limit
+        self._request_times: deque = deque(maxlen=max(1, settings.RATE_LIMIT_REQUESTS_PER_MINUTE))
         self._daily_request_count = 0
-        self._last_reset_date = datetime.now().date()
+        self._day_ends_at = _next_local_midnight()
     
     async def test_connection(self) -> bool:
         """
@@ -73,12 +89,10 @@ class SchemaGenerator:
         Raises:
             RateLimitError: If rate limits would be exceeded
         """
-        now = datetime.now()
-        
-        # Reset daily counter if new day
-        if now.date() > self._last_reset_date:
+        # Reset daily counter if new day (fixed window); one clock read per call
+        if time.time() >= self._day_ends_at:
             self._daily_request_count = 0
-            self._last_reset_date = now.date()
+            self._day_ends_at = _next_local_midnight()
         
         # Check daily limit
         if self._daily_request_count >= settings.RATE_LIMIT_REQUESTS_PER_DAY:
@@ -87,9 +101,11 @@ class SchemaGenerator:
                 "Try again tomorrow."
             )
         
-        # Clean old request times (older than 1 minute)
-        cutoff_time = now.timestamp() - 60
-        self._request_times = [t for t in self._request_times if t > cutoff_time]
+        # Drop request times older than 1 minute (oldest are on the left)
+        cutoff_time = time.monotonic() - 60
+        request_times = self._request_times
+        while request_times and request_times[0] <= cutoff_time:
+            request_times.popleft()
         
         # Check per-minute limit
         if len(self._request_times) >= settings.RATE_LIMIT_REQUESTS_PER_MINUTE:
@@ -100,7 +116,7 @@ class SchemaGenerator:
     
     def _record_request(self) -> None:
         """Record a successful request for rate limiting."""
-        self._request_times.append(time.time())
+        self._request_times.append(time.monotonic())
         self._daily_request_count += 1
     
     def _create_prompt(self, description: str) -> str:
@@ -187,11 +203,14 @@ Example:
             # Clean response text
             cleaned_text = response_text.strip()
             
-            # Remove markdown code blocks if present
-            if cleaned_text.startswith("```json"):
-                cleaned_text = cleaned_text.replace("```json", "").replace("```", "").strip()
-            elif cleaned_text.startswith("```"):
-                cleaned_text = cleaned_text.replace("```", "").strip()
+            # Remove markdown code fences if present (prefix/suffix slices, no full scans)
+            if cleaned_text.startswith("```"):
+                cleaned_text = (
+                    cleaned_text.removeprefix("```json")
+                    .removeprefix("```")
+                    .removesuffix("```")
+                    .strip()
+                )
             
             # Parse JSON
             schema_data = json.loads(cleaned_text)
@@ -226,13 +245,6 @@ Example:
         Raises:
             ValidationError: If schema is invalid
         """
-        required_faker_methods = {
-            "name", "first_name", "last_name", "email", "phone_number", "address",
-            "city", "country", "date", "date_between", "text", "sentence", "paragraph",
-            "random_int", "random_element", "boolean", "pydecimal", "uuid4", "url",
-            "company", "job", "ssn", "credit_card_number", "iban"
-        }
-        
         for field_name, field_config in schema["fields"].items():
             if not isinstance(field_config, dict):
                 raise ValidationError(f"Field '{field_name}' configuration must be a dictionary")
@@ -241,7 +253,7 @@ Example:
                 raise ValidationError(f"Field '{field_name}' missing 'faker_method'")
             
             faker_method = field_config["faker_method"]
-            if faker_method not in required_faker_methods:
+            if faker_method not in _VALID_FAKER_METHODS:
                 # Allow method but warn it might not work
                 continue
             
@@ -281,7 +293,10 @@ Example:
         # Check cache first if caching is enabled
         if self.cache:
             try:
-                cached_schema = self.cache.get_cached_schema(description_hash)
+                cached_schema = (
+                    self.cache.get_memory_cached_schema(description_hash)
+                    or await asyncio.to_thread(self.cache.get_cached_schema, description_hash)
+                )
                 if cached_schema:
                     # Cache hit! Return cached schema
                     return cached_schema
@@ -357,7 +372,7 @@ Example:
             # Save to cache if caching is enabled
             if self.cache:
                 try:
-                    self.cache.save_schema(description_hash, generated_schema)
+                    await asyncio.to_thread(self.cache.save_schema, description_hash, generated_schema)
                 except Exception:
                     # Cache save error shouldn't block response
                     pass
@@ -0,0 +1,44 @@
+"""Sentence embeddings for semantic schema cache lookups."""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.core.config import settings
+
+
+@lru_cache(maxsize=1)
+def _load_model() -> Optional[Any]:
+    """
+    Load the sentence-transformers model once per process.
+
+    Returns:
+        SentenceTransformer instance, or None if the package is not installed
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+    return SentenceTransformer(settings.SEMANTIC_CACHE_MODEL)
+
+
+def embed_description(description: str) -> Optional[Any]:
+    """
+    Embed a description as an L2-normalized vector.
+
+    Normalized vectors make inner product equal to cosine similarity.
+
+    Args:
+        description: Natural language description
+
+    Returns:
+        numpy.ndarray of shape (dim,), or None if semantic caching is disabled
+        or sentence-transformers is unavailable
+    """
+    if not settings.SEMANTIC_CACHE_ENABLED:
+        return None
+
+    model = _load_model()
+    if model is None:
+        return None
+
+    return model.encode(description, normalize_embeddings=True)
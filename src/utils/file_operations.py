@@ -2,44 +2,61 @@
 
 import json
 import fcntl
+import functools
+import mmap
 import os
 import shutil
+import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, Generator, Union
+from typing import Dict, Any, List, Optional, Generator, Tuple, Union
 from datetime import datetime
 
+import orjson
+
+# Files at least this large are parsed straight from a read-only memory map
+# instead of being copied into a bytes object first; below it, a plain read()
+# is cheaper than setting up the mapping
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
 
 @contextmanager
-def file_lock(file_path: Union[str, Path], mode: str = 'r') -> Generator:
+def file_lock(file_path: Union[str, Path], mode: str = 'r', lock_type: Optional[int] = None) -> Generator:
     """
-    Context manager for file operations with exclusive locking.
+    Context manager for file operations with advisory locking.
     
     Ensures atomic file operations to prevent corruption during concurrent access.
-    Uses fcntl.flock for cross-process locking on Unix-like systems.
+    Uses fcntl.flock for cross-process locking on Unix-like systems. Read-only
+    modes take a shared lock so concurrent readers don't serialize; modes that
+    write take an exclusive lock.
     
     Args:
         file_path: Path to the file to lock
         mode: File open mode ('r', 'w', 'a', etc.)
+        lock_type: fcntl.LOCK_SH or fcntl.LOCK_EX (default: derived from mode)
         
     Yields:
-        file: Opened file object with exclusive lock
+        file: Opened file object holding the lock
         
     Example:
         with file_lock('/path/to/file.json', 'w') as f:
             json.dump(data, f)
     """
-    file_path = Path(file_path)
+    writing = bool(set(mode) & set('wax+'))
     
-    # Ensure parent directory exists
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+    # Ensure parent directory exists (reads need the file to be there already)
+    if writing:
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+    
+    # Open file with specified mode (binary modes take no encoding)
+    file_obj = open(file_path, mode) if 'b' in mode else open(file_path, mode, encoding='utf-8')
     
-    # Open file with specified mode
-    file_obj = open(file_path, mode, encoding='utf-8')
+    if lock_type is None:
+        lock_type = fcntl.LOCK_EX if writing else fcntl.LOCK_SH
     
     try:
-        # Acquire exclusive lock (blocks until available)
-        fcntl.flock(file_obj.fileno(), fcntl.LOCK_EX)
+        # Acquire lock (blocks until available)
+        fcntl.flock(file_obj.fileno(), lock_type)
         yield file_obj
     finally:
         # Release lock and close file
@@ -62,26 +79,50 @@ def read_json_file(file_path: Union[str, Path]) -> Dict[str, Any]:
         json.JSONDecodeError: If file contains invalid JSON
         PermissionError: If file cannot be accessed
     """
-    file_path = Path(file_path)
-    
-    if not file_path.exists():
+    if not os.path.exists(file_path):
         raise FileNotFoundError(f"JSON file not found: {file_path}")
     
-    with file_lock(file_path, 'r') as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Invalid JSON in file {file_path}: {e.msg}", e.doc, e.pos)
+    try:
+        with file_lock(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+                content = f.read()
+            else:
+                # Pages are faulted in as orjson walks them; no userspace copy
+                with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mapped:
+                    # orjson reads front to back, so ask for aggressive readahead
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mapped) as view:
+                        return orjson.loads(view)
+        
+        return orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        raise json.JSONDecodeError(f"Invalid JSON in file {file_path}: {e.msg}", e.doc, e.pos)
 
 
-def write_json_file(file_path: Union[str, Path], data: Dict[str, Any], create_backup: bool = True) -> bool:
+def write_json_file(
+    file_path: Union[str, Path],
+    data: Dict[str, Any],
+    create_backup: bool = False,
+    fsync: bool = True
+) -> bool:
     """
-    Write JSON data to file with proper locking and backup creation.
+    Write JSON data to file atomically.
+    
+    The data goes to a temporary file in the same directory, is fsynced, and
+    is renamed over the target, so readers and crashes see either the old or
+    the new content. A failed write leaves the target untouched, so no backup
+    copy is needed for safety.
+    
+    Callers writing many rebuildable files can pass ``fsync=False`` and make
+    the batch durable with one ``fsync_files`` pass over just those files;
+    until then a crash may leave a target empty rather than old.
     
     Args:
         file_path: Path to JSON file
         data: Dictionary data to write
-        create_backup: Whether to create a backup before writing
+        create_backup: Whether to also keep a ``.backup`` snapshot of the previous content
+        fsync: Whether to force the data to disk before the rename
         
     Returns:
         bool: True if write was successful
@@ -90,30 +131,125 @@ def write_json_file(file_path: Union[str, Path], data: Dict[str, Any], create_ba
         PermissionError: If file cannot be written
         OSError: If file system operation fails
     """
-    file_path = Path(file_path)
-    backup_path = file_path.with_suffix(f'{file_path.suffix}.backup')
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
     
-    try:
-        # Create backup if requested and file exists
-        if create_backup and file_path.exists():
+    # Serialize before touching the disk (orjson writes datetimes as ISO 8601 natively)
+    payload = orjson.dumps(data, default=_json_serializer, option=orjson.OPT_NON_STR_KEYS)
+    
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Snapshot the current file as the backup. The replace below gives the
+    # target a new inode, so a hard link keeps the old content without copying.
+    if create_backup and file_path.exists():
+        backup_path = file_path.with_suffix(f'{file_path.suffix}.backup')
+        backup_path.unlink(missing_ok=True)
+        try:
+            os.link(file_path, backup_path)
+        except OSError:
+            # Filesystems without hard link support
             shutil.copy2(file_path, backup_path)
+    
+    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f'.{file_path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            if fsync:
+                f.flush()  # Ensure data is written to disk
+                os.fsync(f.fileno())  # Force OS to write to physical storage
+        os.replace(temp_path, file_path)
+    except BaseException:
+        safe_delete_file(temp_path)
+        raise
+    
+    return True
+
+
+def fsync_files(file_paths: List[Union[str, Path]]) -> None:
+    """
+    Force already written files to disk, one fsync each.
+    
+    Group commit for files written with ``write_json_file(..., fsync=False)``:
+    only these files are synced, unlike ``os.sync()`` which flushes every
+    dirty page on the host.
+    
+    Args:
+        file_paths: Files to make durable
+        
+    Raises:
+        OSError: If a file cannot be opened or synced
+    """
+    for file_path in file_paths:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def append_json_lines(file_path: Union[str, Path], records: List[Dict[str, Any]]) -> None:
+    """
+    Append records to a JSON Lines file with proper locking.
+    
+    All records are written with a single write call and one fsync, so a batch
+    costs the same disk round-trip as a single line and concurrent appenders
+    never interleave within a line.
+    
+    Args:
+        file_path: Path to JSON Lines file (created if missing)
+        records: Dictionary records to append, one per line
         
-        # Write new data with atomic operation
-        with file_lock(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=_json_serializer, ensure_ascii=False)
-            f.flush()  # Ensure data is written to disk
-            os.fsync(f.fileno())  # Force OS to write to physical storage
+    Raises:
+        PermissionError: If file cannot be written
+        OSError: If file system operation fails
+    """
+    payload = b"".join(
+        orjson.dumps(record, default=_json_serializer, option=orjson.OPT_APPEND_NEWLINE)
+        for record in records
+    )
+    
+    with file_lock(file_path, 'ab') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_json_lines(file_path: Union[str, Path], offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Read complete records from a JSON Lines file with proper locking.
+    
+    Reading can resume where a previous call stopped, so a caller tailing an
+    append-only log only parses the newly appended lines. A trailing line
+    without a newline (an append still in progress) is left for the next call.
+    
+    Args:
+        file_path: Path to JSON Lines file
+        offset: Byte offset to start reading from
         
-        return True
+    Returns:
+        tuple: Parsed records in file order (blank lines are skipped) and the
+            offset just past the last complete line
         
-    except (OSError, PermissionError) as e:
-        # If backup exists and write failed, attempt to restore it
-        if create_backup and backup_path.exists():
-            try:
-                shutil.copy2(backup_path, file_path)
-            except (OSError, PermissionError):
-                pass  # Best effort restore
-        raise e
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        json.JSONDecodeError: If a line contains invalid JSON
+        PermissionError: If file cannot be accessed
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"JSON Lines file not found: {file_path}")
+    
+    with file_lock(file_path, 'rb') as f:
+        f.seek(offset)
+        content = f.read()
+    
+    complete = content[:content.rfind(b"\n") + 1]
+    
+    try:
+        records = [orjson.loads(line) for line in complete.splitlines() if line.strip()]
+    except orjson.JSONDecodeError as e:
+        raise json.JSONDecodeError(f"Invalid JSON line in file {file_path}: {e.msg}", e.doc, e.pos)
+    
+    return records, offset + len(complete)
 
 
 def ensure_file_exists(file_path: Union[str, Path], default_content: Optional[Dict[str, Any]] = None) -> bool:
@@ -127,7 +263,8 @@ def ensure_file_exists(file_path: Union[str, Path], default_content: Optional[Di
     Returns:
         bool: True if file exists or was created successfully
     """
-    file_path = Path(file_path)
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
     
     if file_path.exists():
         return True
@@ -140,32 +277,39 @@ def ensure_file_exists(file_path: Union[str, Path], default_content: Optional[Di
         default_content = {}
     
     try:
-        write_json_file(file_path, default_content, create_backup=False)
+        write_json_file(file_path, default_content)
         return True
     except (OSError, PermissionError):
         return False
 
 
-def _json_serializer(obj: Any) -> str:
+@functools.singledispatch
+def _json_serializer(obj: Any) -> Any:
     """
-    Custom JSON serializer for datetime and other non-JSON types.
+    Custom JSON serializer for types orjson does not handle natively.
+    
+    Dispatches on the value's type; types without a registered handler fall
+    back to their ``__dict__``.
     
     Args:
         obj: Object to serialize
         
     Returns:
-        str: JSON-serializable representation
+        JSON-serializable representation
         
     Raises:
         TypeError: If object type is not supported
     """
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    elif hasattr(obj, '__dict__'):
+    if hasattr(obj, '__dict__'):
         # Handle custom objects by converting to dict
         return obj.__dict__
-    else:
-        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@_json_serializer.register
+def _(obj: datetime) -> str:
+    """Serialize datetimes orjson rejects (e.g. subclasses) as ISO 8601."""
+    return obj.isoformat()
 
 
 def get_file_size(file_path: Union[str, Path]) -> int:
@@ -178,10 +322,8 @@ def get_file_size(file_path: Union[str, Path]) -> int:
     Returns:
         int: File size in bytes, 0 if file doesn't exist
     """
-    file_path = Path(file_path)
-    
     try:
-        return file_path.stat().st_size
+        return os.stat(file_path).st_size
     except (OSError, FileNotFoundError):
         return 0
 
@@ -196,11 +338,10 @@ def safe_delete_file(file_path: Union[str, Path]) -> bool:
     Returns:
         bool: True if file was deleted or didn't exist
     """
-    file_path = Path(file_path)
-    
     try:
-        if file_path.exists():
-            file_path.unlink()
+        os.unlink(file_path)
+        return True
+    except FileNotFoundError:
         return True
     except (OSError, PermissionError):
         return False
\ No newline at end of file
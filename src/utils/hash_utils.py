@@ -1,9 +1,16 @@
 """Hash utilities for cache key generation."""
 
 import hashlib
+import hmac
 import re
+from functools import lru_cache
 
 
+# Punctuation with its surrounding whitespace, respaced by _normalize_description
+_PUNCTUATION_PATTERN = re.compile(r'\s*([,.!?;:])\s*')
+
+
+@lru_cache(maxsize=4096)
 def generate_cache_key(description: str) -> str:
     """
     Generate a consistent SHA-256 hash for cache key from description text.
@@ -14,6 +21,9 @@ def generate_cache_key(description: str) -> str:
     - Converts to lowercase for case-insensitive caching
     - Removes extra punctuation spacing
     
+    Results are memoized per description, so repeated prompts skip both
+    normalization and hashing.
+    
     Args:
         description: Raw description text from user input
         
@@ -30,7 +40,7 @@ def generate_cache_key(description: str) -> str:
     # Normalize the description for consistent hashing
     normalized = _normalize_description(description)
     
-    # Generate SHA-256 hash
+    # Generate SHA-256 hash over a single buffer (OpenSSL's accelerated path)
     hash_object = hashlib.sha256(normalized.encode('utf-8'))
     return hash_object.hexdigest()
 
@@ -45,19 +55,13 @@ def _normalize_description(description: str) -> str:
     Returns:
         str: Normalized description text
     """
-    # Convert to lowercase for case-insensitive comparison
-    normalized = description.lower()
-    
-    # Replace multiple whitespace characters (spaces, tabs, newlines) with single space
-    normalized = re.sub(r'\s+', ' ', normalized)
-    
-    # Strip leading and trailing whitespace
-    normalized = normalized.strip()
+    # Lowercase, then collapse whitespace runs (spaces, tabs, newlines) to single
+    # spaces; split() also strips leading and trailing whitespace
+    normalized = ' '.join(description.lower().split())
     
-    # Normalize punctuation spacing (remove extra spaces around punctuation)
-    normalized = re.sub(r'\s*([,.!?;:])\s*', r'\1 ', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized)  # Clean up any double spaces
-    normalized = normalized.strip()
+    # Normalize punctuation spacing: no space before, exactly one after. The
+    # input has no runs to collapse, so only a trailing space can be left over.
+    normalized = _PUNCTUATION_PATTERN.sub(r'\1 ', normalized).rstrip(' ')
     
     return normalized
 
@@ -79,10 +83,10 @@ def validate_hash(hash_string: str) -> bool:
     if len(hash_string) != 64:
         return False
     
-    # Check if all characters are hexadecimal
+    # Check if all characters are hexadecimal (fromhex skips spaces, so the
+    # decoded length must still be the full 32 bytes)
     try:
-        int(hash_string, 16)
-        return True
+        return len(bytes.fromhex(hash_string)) == 32
     except ValueError:
         return False
 
@@ -100,6 +104,6 @@ def hash_matches_description(hash_string: str, description: str) -> bool:
     """
     try:
         expected_hash = generate_cache_key(description)
-        return hash_string == expected_hash
+        return hmac.compare_digest(hash_string, expected_hash)
     except (ValueError, TypeError):
         return False
\ No newline at end of file
@@ -1,20 +1,23 @@
 #!/usr/bin/env python3
 """Test FastAPI endpoints without requiring OpenAI API key."""
 
+import asyncio
 import sys
 import os
 
 # Add project root to path BEFORE importing anything else
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from datetime import datetime
+from types import MappingProxyType
 
 # Import the app BEFORE TestClient
 from main import app
 
 # Now import TestClient
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from src.api.models import GeneratedSchema, SyntheticDataset
 
@@ -22,16 +25,19 @@ from src.api.models import GeneratedSchema, SyntheticDataset
 client = TestClient(app)
 
 
+MOCK_FIELDS_SCHEMA = MappingProxyType({
+    'product_name': {'faker_method': 'catch_phrase'},
+    'category': {'faker_method': 'ecommerce'},
+    'price': {'faker_method': 'price'},
+    'in_stock': {'faker_method': 'boolean'}
+})
+
+
 def create_mock_generated_schema():
     """Create a mock GeneratedSchema for testing."""
     return GeneratedSchema(
         description_hash="test_hash_12345",
-        fields_schema={
-            'product_name': {'faker_method': 'catch_phrase'},
-            'category': {'faker_method': 'ecommerce'},
-            'price': {'faker_method': 'price'},
-            'in_stock': {'faker_method': 'boolean'}
-        },
+        fields_schema=MOCK_FIELDS_SCHEMA,
         created_at=datetime.now(),
         domain="ecommerce"
     )
@@ -129,8 +135,9 @@ def test_generate_endpoint_success(mock_get_schema_gen, mock_get_data_gen, mock_
         filename="test_ecommerce.csv",
         row_count=2
     )
-    mock_csv_exp.export_to_csv.return_value = mock_csv_response
-    mock_csv_exp.get_csv_headers.return_value = {
+    mock_csv_exp.iter_csv.return_value = iter([mock_csv_response.csv_content.encode('utf-8')])
+    mock_csv_exp.generate_filename.return_value = mock_csv_response.filename
+    mock_csv_exp.get_stream_headers.return_value = {
         "Content-Disposition": "attachment; filename=test_ecommerce.csv"
     }
     mock_get_csv_exp.return_value = mock_csv_exp
@@ -153,6 +160,7 @@ def test_generate_endpoint_success(mock_get_schema_gen, mock_get_data_gen, mock_
     assert "X-Generation-Time" in response.headers
     assert "X-Domain" in response.headers
     assert response.headers["X-Domain"] == "ecommerce"
+    assert response.headers["X-Content-Length"] == str(len(response.content))
 
     # Check CSV content
     csv_content = response.text
@@ -298,6 +306,107 @@ def test_cors_headers():
     return True
 
 
+def test_concurrent_read_endpoints():
+    """Test that the read-only endpoints answer correctly when hit concurrently."""
+    print("\n" + "="*60)
+    print("TEST: Concurrent Read Endpoints")
+    print("="*60)
+
+    async def fetch_all():
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as async_client:
+            return await asyncio.gather(
+                async_client.get("/health"),
+                async_client.get("/api/v1/cache/stats"),
+                async_client.get("/openapi.json"),
+            )
+
+    health, cache_stats, openapi = asyncio.run(fetch_all())
+
+    print(f"Status Codes: {[r.status_code for r in (health, cache_stats, openapi)]}")
+
+    assert health.status_code == 200
+    assert health.json()["status"] == "healthy"
+    assert cache_stats.status_code == 200
+    assert "cache_enabled" in cache_stats.json()
+    assert openapi.status_code == 200
+    assert "/api/v1/generate" in openapi.json()["paths"]
+
+    print("✅ Concurrent requests handled correctly!")
+    return True
+
+
+def test_schema_batch_failures_and_deadline():
+    """Test that batch schema generation reports failed entries and honours its deadline."""
+    print("\n" + "="*60)
+    print("TEST: Schema Batch (Mocked Batches API)")
+    print("="*60)
+
+    from src.core.config import settings
+    from src.core.exceptions import APIConnectionError, ParsingError, SchemaGenerationError
+    from src.services.anthropic_schema_generator import AnthropicSchemaGenerator
+
+    descriptions = [
+        "Customer records with names and emails",
+        "Product catalog with names and prices",
+        "Employee directory with departments",
+    ]
+
+    # Settings are frozen, so the generator module gets a patched copy
+    batch_settings = settings.model_copy(update={
+        "API_PROVIDER": "anthropic",
+        "ANTHROPIC_API_KEY": "sk-ant-test",
+        "CACHE_ENABLED": False,
+        "USE_BATCH_API": True,
+        "BATCH_POLL_INITIAL_SECONDS": 0.01,
+        "BATCH_TIMEOUT_SECONDS": 0.05,
+    })
+
+    with patch('src.services.anthropic_schema_generator.settings', batch_settings):
+        generator = AnthropicSchemaGenerator()
+        hashes = [generator._generate_hash(description) for description in descriptions]
+
+        async def entries():
+            succeeded = MagicMock(type="succeeded")
+            succeeded.message.content = [MagicMock(text='{"domain": "crm", "fields": {"name": {"faker_method": "name"}}}')]
+            unparseable = MagicMock(type="succeeded")
+            unparseable.message.content = [MagicMock(text="no schema here")]
+            yield MagicMock(custom_id=hashes[0], result=succeeded)
+            yield MagicMock(custom_id=hashes[1], result=MagicMock(type="errored", error="overloaded_error"))
+            yield MagicMock(custom_id=hashes[2], result=unparseable)
+
+        async def batches_results(batch_id):
+            return entries()
+
+        batches = MagicMock()
+        batches.create = AsyncMock(return_value=MagicMock(id="batch_1", processing_status="in_progress"))
+        batches.retrieve = AsyncMock(return_value=MagicMock(id="batch_1", processing_status="ended"))
+        batches.results = batches_results
+        batches.cancel = AsyncMock()
+        generator.client = MagicMock()
+        generator.client.messages.batches = batches
+
+        results = asyncio.run(generator.generate_schema_batch(descriptions))
+        print(f"Results: { {d[:20]: type(r).__name__ for d, r in results.items()} }")
+
+        assert set(results) == set(descriptions)
+        assert results[descriptions[0]].fields_schema == {"name": {"faker_method": "name"}}
+        assert isinstance(results[descriptions[1]], SchemaGenerationError)
+        assert "errored" in str(results[descriptions[1]])
+        assert isinstance(results[descriptions[2]], ParsingError)
+
+        # A batch that never ends is cancelled once BATCH_TIMEOUT_SECONDS passes
+        batches.retrieve = AsyncMock(return_value=MagicMock(id="batch_1", processing_status="in_progress"))
+        try:
+            asyncio.run(generator.generate_schema_batch(descriptions))
+            assert False, "Expected the batch deadline to raise"
+        except APIConnectionError as e:
+            print(f"Deadline: {e}")
+        batches.cancel.assert_awaited_once_with("batch_1")
+
+    print("✅ Batch failures and deadline handled correctly!")
+    return True
+
+
 def main():
     """Run all API tests."""
     print("🚀 TESTING FASTAPI ENDPOINTS")
@@ -314,6 +423,8 @@ def main():
         ("Rate Limit", test_generate_endpoint_rate_limit),
         ("OpenAPI Schema", test_openapi_schema),
         ("CORS Headers", test_cors_headers),
+        ("Concurrent Reads", test_concurrent_read_endpoints),
+        ("Schema Batch", test_schema_batch_failures_and_deadline),
     ]
 
     passed = 0
@@ -7,11 +7,19 @@ Tests: Config, Mock Schema Generator, Data Generator, CSV Exporter, FastAPI rout
 import os
 import sys
 import asyncio
-from typing import Dict, Any
+import contextvars
+import functools
+import importlib
+import io
+import logging
+from types import ModuleType
+from typing import Dict, Any, Awaitable, Optional, TextIO, Tuple, Union
 
 # Set demo mode before importing any modules
 os.environ["DEMO_MODE"] = "true"
 
+logger = logging.getLogger(__name__)
+
 # Color codes for terminal output
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -20,6 +28,54 @@ BLUE = "\033[94m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+# Banner rules, built once
+RULE = "=" * 60
+BLUE_RULE = f"{BOLD}{BLUE}{RULE}{RESET}"
+GREEN_RULE = f"{BOLD}{GREEN}{RULE}{RESET}"
+RED_RULE = f"{BOLD}{RED}{RULE}{RESET}"
+
+
+# Output buffer of the stage running in the current task (and the threads it
+# hands work to); None writes straight through
+_stage_output: contextvars.ContextVar[Optional[io.StringIO]] = contextvars.ContextVar(
+    "stage_output", default=None
+)
+
+
+class _StageStdout(io.TextIOBase):
+    """sys.stdout stand-in that buffers each stage's writes so concurrent stages don't interleave."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        return (_stage_output.get() or self.stream).write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+async def run_stage(test: Awaitable[bool]) -> bool:
+    """Run one test stage with its output buffered, then print the output in one piece."""
+    buffer = io.StringIO()
+    token = _stage_output.set(buffer)
+    try:
+        return await test
+    finally:
+        _stage_output.reset(token)
+        print(buffer.getvalue(), end="", flush=True)
+
+
+def _import_app_modules() -> Tuple[Union[ModuleType, BaseException], Union[ModuleType, BaseException]]:
+    """Import the app, then the Gradio frontend; an import failure is returned, not raised."""
+    modules = []
+    for name in ("main", "src.frontend.gradio_app"):
+        try:
+            modules.append(importlib.import_module(name))
+        except Exception as e:
+            modules.append(e)
+    return modules[0], modules[1]
+
 
 def print_test(message: str):
     """Print test message."""
@@ -43,9 +99,29 @@ def print_info(message: str):
 
 def print_section(title: str):
     """Print section header."""
-    print(f"\n{BOLD}{BLUE}{'='*60}{RESET}")
-    print(f"{BOLD}{BLUE}{title:^60}{RESET}")
-    print(f"{BOLD}{BLUE}{'='*60}{RESET}\n")
+    print(f"\n{BLUE_RULE}\n{BOLD}{BLUE}{title:^60}{RESET}\n{BLUE_RULE}\n")
+
+
+# Shared service instances; imported lazily so DEMO_MODE is set first
+@functools.lru_cache(maxsize=1)
+def _schema_gen():
+    """Return the shared MockSchemaGenerator."""
+    from src.services.mock_schema_generator import MockSchemaGenerator
+    return MockSchemaGenerator()
+
+
+@functools.lru_cache(maxsize=1)
+def _data_gen():
+    """Return the shared DataGenerator."""
+    from src.services.data_generator import DataGenerator
+    return DataGenerator.get()
+
+
+@functools.lru_cache(maxsize=1)
+def _csv_exporter():
+    """Return the shared CSVExporter."""
+    from src.services.csv_exporter import CSVExporter
+    return CSVExporter()
 
 
 async def test_config():
@@ -70,30 +146,33 @@ async def test_config():
         return False
 
 
+# Descriptions and the domain the mock schema generator should detect for each
+MOCK_SCHEMA_TEST_CASES = (
+    ("E-commerce product catalog with names and prices", "ecommerce"),
+    ("Healthcare patient records with medical data", "healthcare"),
+    ("Financial transactions and accounts", "finance"),
+    ("Employee database with salaries", "business"),
+    ("Social media user profiles", "social_media"),
+    ("Student records with grades", "education"),
+    ("General dataset with names and emails", "general"),
+)
+
+
 async def test_mock_schema_generator():
     """Test mock schema generator."""
     print_section("Testing Mock Schema Generator")
 
     try:
-        from src.services.mock_schema_generator import MockSchemaGenerator
-
-        generator = MockSchemaGenerator()
+        generator = _schema_gen()
         print_success("Mock schema generator initialized")
 
         # Test different domains
-        test_cases = [
-            ("E-commerce product catalog with names and prices", "ecommerce"),
-            ("Healthcare patient records with medical data", "healthcare"),
-            ("Financial transactions and accounts", "finance"),
-            ("Employee database with salaries", "business"),
-            ("Social media user profiles", "social_media"),
-            ("Student records with grades", "education"),
-            ("General dataset with names and emails", "general"),
-        ]
-
-        for description, expected_domain in test_cases:
+        schemas = await asyncio.gather(
+            *(generator.generate_schema(description) for description, _ in MOCK_SCHEMA_TEST_CASES)
+        )
+
+        for (description, expected_domain), schema in zip(MOCK_SCHEMA_TEST_CASES, schemas):
             print_test(f"Testing: '{description[:50]}...'")
-            schema = await generator.generate_schema(description)
 
             assert schema is not None, "Schema should not be None"
             assert schema.domain == expected_domain, f"Expected domain {expected_domain}, got {schema.domain}"
@@ -105,8 +184,7 @@ async def test_mock_schema_generator():
         return True
     except Exception as e:
         print_error(f"Mock schema generator test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Mock schema generator test traceback")
         return False
 
 
@@ -115,11 +193,8 @@ async def test_data_generation():
     print_section("Testing Data Generation")
 
     try:
-        from src.services.mock_schema_generator import MockSchemaGenerator
-        from src.services.data_generator import DataGenerator
-
-        schema_gen = MockSchemaGenerator()
-        data_gen = DataGenerator()
+        schema_gen = _schema_gen()
+        data_gen = _data_gen()
         print_success("Generators initialized")
 
         # Generate schema
@@ -141,11 +216,24 @@ async def test_data_generation():
         print_info(f"Fields: {', '.join(dataset.field_names)}")
         print_info(f"Sample row: {dataset.data[0]}")
 
+        # A parameterized Faker call that fails outright falls back to placeholders
+        print_test("Generating a column whose Faker parameters fail...")
+        from datetime import datetime
+        from src.api.models import GeneratedSchema
+        failing_schema = GeneratedSchema(
+            description_hash=schema.description_hash,
+            fields_schema={"f": {"faker_method": "word", "parameters": {"ext_word_list": []}}},
+            created_at=datetime.now(),
+            domain="general"
+        )
+        failing_dataset = data_gen.generate_data(failing_schema, 3)
+        assert failing_dataset.columns["f"] == [f"sample_f_{i}" for i in range(3)], "Expected placeholder values"
+        print_success("Failing parameterized method fell back to placeholders")
+
         return True
     except Exception as e:
         print_error(f"Data generation test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Data generation test traceback")
         return False
 
 
@@ -154,14 +242,10 @@ async def test_csv_export():
     print_section("Testing CSV Export")
 
     try:
-        from src.services.mock_schema_generator import MockSchemaGenerator
-        from src.services.data_generator import DataGenerator
-        from src.services.csv_exporter import CSVExporter
-
         # Generate data
-        schema_gen = MockSchemaGenerator()
-        data_gen = DataGenerator()
-        csv_exporter = CSVExporter()
+        schema_gen = _schema_gen()
+        data_gen = _data_gen()
+        csv_exporter = _csv_exporter()
 
         schema = await schema_gen.generate_schema("Healthcare patient data")
         dataset = data_gen.generate_data(schema, 5)
@@ -182,77 +266,91 @@ async def test_csv_export():
         return True
     except Exception as e:
         print_error(f"CSV export test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("CSV export test traceback")
         return False
 
 
-async def test_fastapi_routes():
+def _loaded(module: Union[ModuleType, BaseException]) -> ModuleType:
+    """Return a module preloaded by main(), re-raising its import error if it failed."""
+    if isinstance(module, BaseException):
+        raise module
+    return module
+
+
+async def test_fastapi_routes(app_module: Union[ModuleType, BaseException]):
     """Test FastAPI routes with demo mode."""
     print_section("Testing FastAPI Routes")
 
     try:
-        from fastapi.testclient import TestClient
-        from main import app
-
-        client = TestClient(app)
-        print_success("Test client created")
+        from httpx import ASGITransport, AsyncClient
+        app = _loaded(app_module).app
+
+        # Run the app's startup/shutdown handlers once around all requests
+        async with (
+            app.router.lifespan_context(app),
+            AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client,
+        ):
+            print_success("Test client created")
+
+            # The requests are independent, so issue them concurrently
+            print_test("Testing /health, /api/v1/generate and /api/v1/cache/stats endpoints...")
+            health_response, generate_response, stats_response = await asyncio.gather(
+                client.get("/health"),
+                client.post(
+                    "/api/v1/generate",
+                    json={
+                        "description": "E-commerce product catalog with names, prices, and categories",
+                        "rows": 20,
+                        "format": "csv"
+                    }
+                ),
+                client.get("/api/v1/cache/stats"),
+            )
 
         # Test health check
-        print_test("Testing /health endpoint...")
-        response = client.get("/health")
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        data = response.json()
+        assert health_response.status_code == 200, f"Expected 200, got {health_response.status_code}"
+        data = health_response.json()
         assert data["status"] == "healthy", "Health status should be healthy"
         assert data["demo_mode"] is True, "Demo mode should be True"
         print_success(f"Health check passed: {data}")
 
         # Test generate endpoint
-        print_test("Testing /api/v1/generate endpoint...")
-        response = client.post(
-            "/api/v1/generate",
-            json={
-                "description": "E-commerce product catalog with names, prices, and categories",
-                "rows": 20,
-                "format": "csv"
-            }
-        )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        assert "X-Demo-Mode" in response.headers, "Should have demo mode header"
-        assert "X-Domain" in response.headers, "Should have domain header"
-        assert "X-Generation-Time" in response.headers, "Should have generation time header"
+        assert generate_response.status_code == 200, f"Expected 200, got {generate_response.status_code}"
+        assert "X-Demo-Mode" in generate_response.headers, "Should have demo mode header"
+        assert "X-Domain" in generate_response.headers, "Should have domain header"
+        assert "X-Generation-Time" in generate_response.headers, "Should have generation time header"
 
-        csv_content = response.text
+        csv_content = generate_response.text
         assert len(csv_content) > 0, "CSV content should not be empty"
         lines = csv_content.strip().split('\n')
         assert len(lines) >= 21, f"Expected at least 21 lines (header + 20 rows), got {len(lines)}"
 
         print_success(f"Generated {len(lines)-1} rows of CSV data")
-        print_info(f"Domain: {response.headers.get('X-Domain')}")
-        print_info(f"Generation time: {response.headers.get('X-Generation-Time')}s")
-        print_info(f"Demo mode: {response.headers.get('X-Demo-Mode')}")
+        print_info(f"Domain: {generate_response.headers.get('X-Domain')}")
+        print_info(f"Generation time: {generate_response.headers.get('X-Generation-Time')}s")
+        print_info(f"Demo mode: {generate_response.headers.get('X-Demo-Mode')}")
 
         # Test cache stats
-        print_test("Testing /api/v1/cache/stats endpoint...")
-        response = client.get("/api/v1/cache/stats")
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        print_success(f"Cache stats: {response.json()}")
+        assert stats_response.status_code == 200, f"Expected 200, got {stats_response.status_code}"
+        print_success(f"Cache stats: {stats_response.json()}")
 
         return True
     except Exception as e:
         print_error(f"FastAPI routes test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("FastAPI routes test traceback")
         return False
 
 
-async def test_gradio_integration():
+async def test_gradio_integration(
+    gradio_module: Union[ModuleType, BaseException],
+    app_module: Union[ModuleType, BaseException]
+):
     """Test Gradio integration."""
     print_section("Testing Gradio Integration")
 
     try:
         print_test("Importing Gradio app...")
-        from src.frontend.gradio_app import create_gradio_interface
+        create_gradio_interface = _loaded(gradio_module).create_gradio_interface
         import gradio as gr
 
         print_success(f"Gradio version: {gr.__version__}")
@@ -263,7 +361,7 @@ async def test_gradio_integration():
         print_success("Gradio interface created successfully")
 
         print_test("Checking if Gradio is mounted in main app...")
-        from main import app
+        app = _loaded(app_module).app
         # Check if Gradio routes are registered
         routes = [route.path for route in app.routes]
         has_gradio = any("/gradio" in path for path in routes)
@@ -275,27 +373,38 @@ async def test_gradio_integration():
         return True
     except Exception as e:
         print_error(f"Gradio integration test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Gradio integration test traceback")
         return False
 
 
 async def main():
     """Run all tests."""
-    print(f"\n{BOLD}{GREEN}{'='*60}{RESET}")
+    # Stage output (failure tracebacks included) is printed per stage once it finishes
+    sys.stdout = _StageStdout(sys.stdout)
+    logging.basicConfig(level=logging.ERROR, format="%(message)s", stream=sys.stdout)
+
+    print(f"\n{GREEN_RULE}")
     print(f"{BOLD}{GREEN}Demo Mode Test Suite - Full Stack Testing{RESET}")
     print(f"{BOLD}{GREEN}Testing without OpenAI API Key{RESET}")
-    print(f"{BOLD}{GREEN}{'='*60}{RESET}")
-
-    results = []
-
-    # Run tests
-    results.append(("Configuration", await test_config()))
-    results.append(("Mock Schema Generator", await test_mock_schema_generator()))
-    results.append(("Data Generation", await test_data_generation()))
-    results.append(("CSV Export", await test_csv_export()))
-    results.append(("FastAPI Routes", await test_fastapi_routes()))
-    results.append(("Gradio Integration", await test_gradio_integration()))
+    print(GREEN_RULE)
+
+    # Import the app and the Gradio frontend once, in order and off the event
+    # loop. An import failure is reported by the test that needs the module.
+    app_module, gradio_module = await asyncio.to_thread(_import_app_modules)
+
+    tests = [
+        ("Configuration", test_config()),
+        ("Mock Schema Generator", test_mock_schema_generator()),
+        ("Data Generation", test_data_generation()),
+        ("CSV Export", test_csv_export()),
+        ("FastAPI Routes", test_fastapi_routes(app_module)),
+        ("Gradio Integration", test_gradio_integration(gradio_module, app_module)),
+    ]
+
+    # Run tests concurrently; the stages share no state. An exception that
+    # escapes a test counts as a failure.
+    outcomes = await asyncio.gather(*(run_stage(test) for _, test in tests), return_exceptions=True)
+    results = [(test_name, outcome is True) for (test_name, _), outcome in zip(tests, outcomes)]
 
     # Print summary
     print_section("Test Summary")
@@ -310,18 +419,18 @@ async def main():
     print(f"\n{BOLD}Results: {passed}/{total} tests passed{RESET}")
 
     if passed == total:
-        print(f"\n{BOLD}{GREEN}{'='*60}{RESET}")
+        print(f"\n{GREEN_RULE}")
         print(f"{BOLD}{GREEN}🎉 All tests passed! Demo mode is working perfectly!{RESET}")
-        print(f"{BOLD}{GREEN}{'='*60}{RESET}\n")
+        print(f"{GREEN_RULE}\n")
         print(f"{BOLD}You can now run the application without an API key:{RESET}")
         print(f"  {YELLOW}DEMO_MODE=true uv run python main.py{RESET}")
         print(f"\n{BOLD}Or for testing:{RESET}")
         print(f"  {YELLOW}DEMO_MODE=true uv run uvicorn main:app --reload{RESET}\n")
         return 0
     else:
-        print(f"\n{BOLD}{RED}{'='*60}{RESET}")
+        print(f"\n{RED_RULE}")
         print(f"{BOLD}{RED}❌ Some tests failed. Please check the output above.{RESET}")
-        print(f"{BOLD}{RED}{'='*60}{RESET}\n")
+        print(f"{RED_RULE}\n")
         return 1
 
 